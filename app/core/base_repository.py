@@ -4,13 +4,18 @@ Generic repository base class for SQLAlchemy models with async CRUD operations.
 Features:
     - Type-safe operations: BaseRepository[ModelType, IDType]
     - CRUD operations: create, read, update, delete
-    - Bulk operations: create_many, update_many, delete_many
-    - Filtering, pagination, and counting
+    - Bulk operations: create_many, create_many_bulk, copy_many, update_many, delete_many
+    - Filtering, offset and keyset pagination, and counting
+    - Core row insert/reads (create_row, get_all_rows, stream_rows) that skip ORM instance
+      construction
     - Soft delete support (requires 'deleted_at' field)
+    - Opt-in raiseload for lazy relationships (_RAISE_ON_LAZY_LOAD) to catch N+1
     - Automatic error handling with rollback
 
 Usage:
     class UserRepository(BaseRepository[User, int]):
+        __slots__ = ()  # keep instances slotted (see BaseRepository)
+
         async def find_by_email(self, email: str) -> User | None:
             result = await self.session.execute(
                 select(User).where(User.email == email)
@@ -24,13 +29,31 @@ Usage:
 """
 
 from abc import ABC
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
 from datetime import UTC, datetime
-from typing import Any, Generic, TypeVar
-
-from sqlalchemy import asc, delete, desc, func, select, update
+from functools import partial
+from itertools import islice
+from typing import Any, ClassVar, Generic, TypeVar, get_args, get_origin
+
+from sqlalchemy import (
+    Select,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
 __all__ = ["BaseRepository"]
 
@@ -38,10 +61,317 @@ __all__ = ["BaseRepository"]
 ModelType = TypeVar("ModelType")
 IDType = TypeVar("IDType", int, str)
 
+# Read statements keyed by (model, operation, query shape). Filter values, limit
+# and offset are bound at execution time, so each shape is built only once.
+# DML is not cached: ORM session synchronization evaluates the criteria and values
+# in Python and cannot see execution-time bind parameters.
+_STATEMENT_CACHE: dict[tuple[Any, ...], Select[Any]] = {}
+
+# Per-model field name -> (ORM attribute, Table column), built on first use
+_FIELD_CACHE: dict[type, dict[str, tuple[Any, Any]]] = {}
+
+# Per-model raiseload options for lazy="select" relationships, built on first use
+_LAZY_RAISE_CACHE: dict[type, tuple[ORMOption, ...]] = {}
+
+
+def _fields(model: type) -> dict[str, tuple[Any, Any]]:
+    """Get cached field name -> (ORM attribute, Table column) map for a model."""
+    fields = _FIELD_CACHE.get(model)
+    if fields is None:
+        fields = _FIELD_CACHE[model] = {
+            key: (getattr(model, key), column) for key, column in sa_inspect(model).columns.items()
+        }
+    return fields
+
+
+def _orm_column(model: type, field: str) -> Any:
+    """Resolve a field name to its ORM attribute (falls back to non-column attributes)."""
+    entry = _fields(model).get(field)
+    return entry[0] if entry is not None else getattr(model, field)
+
+
+def _core_column(model: type, field: str) -> Any:
+    """Resolve a mapped attribute name to its Table column."""
+    entry = _fields(model).get(field)
+    if entry is None:
+        msg = f"{model.__name__} has no column attribute '{field}'"
+        raise AttributeError(msg)
+    return entry[1]
+
+
+def _plain_table(model: type, fields: Iterable[str]) -> bool:
+    """Check whether a query over these fields can target the model's Table directly.
+
+    Inherited mappers (single-table discriminator, joined-table FROM) and
+    non-column attributes need the mapped entity instead.
+    """
+    if sa_inspect(model).inherits is not None:
+        return False
+    columns = _fields(model)
+    return all(field in columns for field in fields)
+
+
+def _select_statement(
+    model: type,
+    operation: str,
+    filter_shape: tuple[tuple[str, bool], ...] = (),
+    has_limit: bool = False,
+    has_offset: bool = False,
+    order_by: str | None = None,
+    order_desc: bool = False,
+    options: tuple[ORMOption, ...] = (),
+    columns: tuple[str, ...] = (),
+) -> Select[Any]:
+    """Get (building once) the SELECT for a query shape.
+
+    Args:
+        model: SQLAlchemy model class
+        operation: "select", "rows" or "count" (see BaseRepository._select)
+        filter_shape: (field, is_null) pairs in filter order
+        has_limit: Bind a page_limit parameter
+        has_offset: Bind a page_offset parameter
+        order_by: Column name to sort by
+        order_desc: Sort descending if True
+        options: Loader options for the "select" operation
+        columns: Column subset for the "rows" operation (all columns if empty)
+
+    Returns:
+        Statement with filter_<field>/page_limit/page_offset bind parameters
+    """
+    key = (
+        model,
+        operation,
+        filter_shape,
+        has_limit,
+        has_offset,
+        order_by,
+        order_desc,
+        options,
+        columns,
+    )
+    stmt = _STATEMENT_CACHE.get(key)
+    if stmt is not None:
+        return stmt
+
+    fields = [field for field, _ in filter_shape]
+    fields.extend(columns)
+    if order_by is not None:
+        fields.append(order_by)
+
+    if operation == "select":
+        stmt = select(model).options(*options)
+        column = partial(_orm_column, model)
+    elif _plain_table(model, fields):
+        # Core statement over plain Table columns: no ORM compile or mapper work
+        table = model.__table__  # type: ignore[attr-defined]
+        column = partial(_core_column, model)
+        if operation == "count":
+            stmt = select(func.count()).select_from(table)
+        elif columns:
+            stmt = select(*(column(field) for field in columns))
+        else:
+            stmt = select(table)
+    else:
+        # Mapped entity: keeps the inheritance discriminator/join and resolves
+        # non-column attributes (e.g. hybrids)
+        column = partial(_orm_column, model)
+        if operation == "count":
+            stmt = select(func.count()).select_from(model)
+        else:
+            stmt = select(*(column(field) for field in columns or _fields(model)))
+
+    conditions = [
+        column(field).is_(None) if is_null else column(field) == bindparam(f"filter_{field}")
+        for field, is_null in filter_shape
+    ]
+    if conditions:
+        stmt = stmt.where(*conditions)
+
+    if order_by is not None:
+        col = column(order_by)
+        stmt = stmt.order_by(desc(col) if order_desc else asc(col))
+
+    if has_offset:
+        stmt = stmt.offset(bindparam("page_offset"))
+    if has_limit:
+        stmt = stmt.limit(bindparam("page_limit"))
+
+    _STATEMENT_CACHE[key] = stmt
+    return stmt
+
+
+def _seek_statement(
+    model: type,
+    filter_shape: tuple[tuple[str, bool], ...],
+    order_by: str,
+    order_desc: bool,
+    has_cursor: bool,
+    options: tuple[ORMOption, ...] = (),
+) -> Select[Any]:
+    """Get (building once) the keyset-pagination SELECT for a query shape.
+
+    Rows are ordered by (order_by, id) and, with a cursor, start strictly after
+    the bound (after_value, after_id) pair, so the database seeks instead of
+    scanning and discarding OFFSET rows.
+    """
+    key = (model, "seek", filter_shape, order_by, order_desc, has_cursor, options)
+    stmt = _STATEMENT_CACHE.get(key)
+    if stmt is not None:
+        return stmt
+
+    stmt = _select_statement(model, "select", filter_shape, has_limit=True, options=options)
+    id_col = _orm_column(model, "id")
+    sort_cols = (id_col,) if order_by == "id" else (_orm_column(model, order_by), id_col)
+
+    if has_cursor:
+        if len(sort_cols) == 1:
+            position, cursor = id_col, bindparam("after_id")
+        else:
+            position = tuple_(*sort_cols)
+            cursor = tuple_(bindparam("after_value"), bindparam("after_id"))
+        stmt = stmt.where(position < cursor if order_desc else position > cursor)
+
+    direction = desc if order_desc else asc
+    stmt = stmt.order_by(*(direction(col) for col in sort_cols))
+
+    _STATEMENT_CACHE[key] = stmt
+    return stmt
+
+
+def _lazy_raise_options(model: type) -> tuple[ORMOption, ...]:
+    """Get (building once) raiseload options for the model's lazy="select" relationships.
+
+    A wildcard raiseload("*") would also override eager strategies configured on
+    the mapper, so only relationships that would otherwise lazy load are covered.
+    """
+    options = _LAZY_RAISE_CACHE.get(model)
+    if options is None:
+        options = _LAZY_RAISE_CACHE[model] = tuple(
+            raiseload(rel.class_attribute)
+            for rel in sa_inspect(model).relationships
+            if rel.lazy == "select"
+        )
+    return options
+
+
+def _exists_statement(model: type) -> Select[Any]:
+    """Get (building once) the SELECT 1 ... LIMIT 1 existence check by ID.
+
+    Built against the primary key's Table (Core only): no column projection,
+    no ORM entity/mapper involvement, and the scan stops at the first match.
+
+    Raises:
+        ValueError: If the model has a composite primary key
+    """
+    key = (model, "exists")
+    stmt = _STATEMENT_CACHE.get(key)
+    if stmt is None:
+        primary_key = _primary_key(model)
+        if primary_key is None:
+            msg = f"{model.__name__} has a composite primary key"
+            raise ValueError(msg)
+        stmt = _STATEMENT_CACHE[key] = (
+            select(literal(1))
+            .select_from(primary_key.table)
+            .where(primary_key == bindparam("filter_id"))
+            .limit(1)
+        )
+    return stmt
+
+
+def _primary_key(model: type) -> Any:
+    """Get the model's single primary key column (None if composite)."""
+    primary_key = sa_inspect(model).primary_key
+    return primary_key[0] if len(primary_key) == 1 else None
+
+
+def _copy_records(
+    table: Any, rows: Sequence[dict[str, Any]]
+) -> tuple[list[str], list[tuple[Any, ...]]]:
+    """Build COPY column names and records, filling Python-side column defaults.
+
+    COPY writes only the columns it is given, so defaults for the other columns
+    are applied here: scalars once, callables once per row (e.g. ``uuid4`` must
+    yield a distinct value for every record). Callables receive no execution
+    context, so defaults reading ``context.get_current_parameters()`` fail here.
+    Every row must have the keys of the first one.
+    """
+    keys = list(rows[0])
+    given = set(keys)
+    scalars: dict[str, Any] = {}
+    callables: dict[str, Callable[[Any], Any]] = {}
+    for key, column in table.c.items():
+        default = column.default
+        if key in given or default is None:
+            continue
+        if default.is_scalar:
+            scalars[key] = default.arg
+        elif default.is_callable:
+            callables[key] = default.arg
+
+    fixed = tuple(scalars.values())
+    records = [
+        (
+            *(row[key] for key in keys),
+            *fixed,
+            *(make(None) for make in callables.values()),
+        )
+        for row in rows
+    ]
+    columns = [table.c[key].name for key in (*keys, *scalars, *callables)]
+    return columns, records
+
 
 class BaseRepository(Generic[ModelType, IDType], ABC):
     """Base repository with async CRUD operations for SQLAlchemy models."""
 
+    # Repositories are created per request; avoid a per-instance __dict__.
+    # Subclasses must declare __slots__ too (``__slots__ = ()`` when adding no
+    # instance attributes), or their instances get a __dict__ again.
+    __slots__ = ("_supports_soft_delete", "model", "session")
+
+    # Max IDs per IN (...) clause in bulk update/delete (SQLite caps bound
+    # parameters, PostgreSQL plans degrade on very large IN lists)
+    _BULK_CHUNK_SIZE = 500
+
+    # Max rows held in memory per INSERT batch in create_many/create_many_bulk
+    _INSERT_CHUNK_SIZE = 1000
+
+    # Extra loader options applied to every ORM read (e.g. selectinload(...))
+    _LOAD_OPTIONS: ClassVar[tuple[ORMOption, ...]] = ()
+
+    # Raise instead of lazy loading relationships left at lazy="select", turning
+    # accidental N+1 queries into errors. Mapper-level eager strategies
+    # (lazy="selectin"/"joined") are kept.
+    _RAISE_ON_LAZY_LOAD: ClassVar[bool] = False
+
+    # Rows fetched per round trip by stream_rows
+    _STREAM_YIELD_PER = 200
+
+    # Min rows for copy_many to use PostgreSQL COPY; smaller batches use executemany
+    _COPY_MIN_ROWS = 100
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Prebuild fixed-shape statements when a subclass binds a concrete model.
+
+        For ``class UserRepository(BaseRepository[User, int])`` the exists-by-ID
+        and count-all statements are built at class creation instead of on first
+        use. Only Core (Table-based) shapes are prebuilt so that mapper
+        configuration is not forced before all models are imported; ORM shapes
+        are still built lazily and cached. Composite primary keys have no
+        exists-by-ID statement and are skipped.
+        """
+        super().__init_subclass__(**kwargs)
+        for base in getattr(cls, "__orig_bases__", ()):
+            if get_origin(base) is not BaseRepository:
+                continue
+            model = get_args(base)[0]
+            if not (isinstance(model, type) and hasattr(model, "__table__")):
+                continue
+            if _primary_key(model) is not None:
+                _exists_statement(model)
+            _select_statement(model, "count")
+
     def __init__(self, model: type[ModelType], session: AsyncSession) -> None:
         """Initialize repository.
 
@@ -51,11 +381,95 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         """
         self.model = model
         self.session = session
+        self._supports_soft_delete = hasattr(model, "deleted_at")
+
+    def _load_options(self) -> tuple[ORMOption, ...]:
+        """Loader options for ORM reads: _LOAD_OPTIONS plus opt-in lazy-load raising."""
+        if not self._RAISE_ON_LAZY_LOAD:
+            return self._LOAD_OPTIONS
+        return self._LOAD_OPTIONS + _lazy_raise_options(self.model)
+
+    def _select(
+        self,
+        operation: str,
+        filters: dict[str, Any],
+        limit: int | None = None,
+        offset: int | None = None,
+        order_by: str | None = None,
+        order_desc: bool = False,
+        columns: Sequence[str] = (),
+    ) -> tuple[Select[Any], dict[str, Any]]:
+        """Get cached SELECT for this query shape along with its bind parameters.
+
+        Args:
+            operation: "select" for ORM instances, "rows" for plain rows, "count"
+                for a row count (Core over the Table unless inheritance or
+                non-column filters need the mapped entity)
+            filters: Field-value pairs (None values render as IS NULL)
+            limit: Max records
+            offset: Records to skip
+            order_by: Column name to sort by
+            order_desc: Sort descending if True
+            columns: Column subset for "rows" (all columns if empty)
+
+        Returns:
+            Tuple of (statement, parameters)
+        """
+        bound, criteria = self._split_filters(filters)
+        stmt = _select_statement(
+            self.model,
+            operation,
+            tuple((field, value is None) for field, value in bound.items()),
+            limit is not None,
+            offset is not None,
+            order_by,
+            order_desc,
+            self._load_options(),
+            tuple(columns),
+        )
+        if criteria:
+            stmt = stmt.where(*criteria)
 
-    async def create(self, **kwargs: Any) -> ModelType:
+        params = {f"filter_{field}": value for field, value in bound.items() if value is not None}
+        if offset is not None:
+            params["page_offset"] = offset
+        if limit is not None:
+            params["page_limit"] = limit
+        return stmt, params
+
+    def _split_filters(self, filters: dict[str, Any]) -> tuple[dict[str, Any], list[Any]]:
+        """Split filters into bindable column filters and per-call literal criteria.
+
+        Relationship and hybrid comparisons expand against the value itself
+        (e.g. ``owner=obj`` becomes ``owner_id = obj.id``), so a cached bind
+        parameter cannot stand in for it. Filters on such attributes make the
+        whole statement literal and uncached.
+
+        Returns:
+            Tuple of (column filters, literal criteria)
+        """
+        columns = _fields(self.model)
+        if all(field in columns for field in filters):
+            return filters, []
+        return {}, [_orm_column(self.model, field) == value for field, value in filters.items()]
+
+    def _chunk_rows(self, items: Iterable[dict[str, Any]]) -> Iterator[list[dict[str, Any]]]:
+        """Consume rows in lists of at most _INSERT_CHUNK_SIZE without materializing all."""
+        iterator = iter(items)
+        while chunk := [dict(item) for item in islice(iterator, self._INSERT_CHUNK_SIZE)]:
+            yield chunk
+
+    def _chunk_ids(self, ids: Sequence[IDType]) -> Iterator[Sequence[IDType]]:
+        """Split IDs into slices of at most _BULK_CHUNK_SIZE for IN (...) clauses."""
+        size = self._BULK_CHUNK_SIZE
+        for start in range(0, len(ids), size):
+            yield ids[start : start + size]
+
+    async def create(self, flush: bool = True, **kwargs: Any) -> ModelType:
         """Create a new record.
 
         Args:
+            flush: Flush immediately (False defers SQL and integrity errors to commit)
             **kwargs: Field values
 
         Returns:
@@ -64,8 +478,9 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         try:
             instance = self.model(**kwargs)
             self.session.add(instance)
-            await self.session.flush()
-            await self.session.refresh(instance)
+            if flush:
+                await self.session.flush()
+                await self.session.refresh(instance)
         except IntegrityError:
             await self.session.rollback()
             raise
@@ -75,21 +490,63 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         else:
             return instance
 
-    async def create_many(self, items: Sequence[dict[str, Any]]) -> Sequence[ModelType]:
+    async def create_row(self, **kwargs: Any) -> RowMapping:
+        """Create a record via Core INSERT (... RETURNING), without an ORM instance.
+
+        Skips the unit of work (instance construction, identity map, flush and
+        refresh). Prefer this over create when the new row is serialized straight
+        to the response.
+
+        Args:
+            **kwargs: Field values
+
+        Returns:
+            Dict-like row of all columns keyed by column name
+        """
+        table = self.model.__table__  # type: ignore[attr-defined]
+        try:
+            if self.session.get_bind().dialect.insert_returning:
+                result = await self.session.execute(
+                    insert(table).values(**kwargs).returning(*table.c)
+                )
+            else:
+                # No RETURNING (MySQL/MariaDB): read the row back by its new key
+                inserted = await self.session.execute(insert(table).values(**kwargs))
+                result = await self.session.execute(
+                    select(table).where(table.c.id == inserted.inserted_primary_key[0])
+                )
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+        else:
+            return result.mappings().one()
+
+    async def create_many(self, items: Iterable[dict[str, Any]]) -> Sequence[ModelType]:
         """Create multiple records.
 
         Args:
-            items: List of field value dicts
+            items: Field value dicts (any iterable; consumed in chunks)
 
         Returns:
             Created instances
         """
+        instances: list[ModelType] = []
+        # MySQL/MariaDB have no INSERT ... RETURNING
+        use_returning = self.session.get_bind().dialect.insert_executemany_returning
         try:
-            instances = [self.model(**item) for item in items]
-            self.session.add_all(instances)
-            await self.session.flush()
-            for instance in instances:
-                await self.session.refresh(instance)
+            if use_returning:
+                # INSERT ... RETURNING per chunk (batched via insertmanyvalues) instead of
+                # flush + one refresh SELECT per row
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                for chunk in self._chunk_rows(items):
+                    result = await self.session.execute(stmt, chunk)
+                    instances.extend(result.scalars())
+            else:
+                for chunk in self._chunk_rows(items):
+                    batch = [self.model(**row) for row in chunk]
+                    self.session.add_all(batch)
+                    await self.session.flush()
+                    instances.extend(batch)
         except IntegrityError:
             await self.session.rollback()
             raise
@@ -99,6 +556,90 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         else:
             return instances
 
+    async def create_many_bulk(self, items: Iterable[dict[str, Any]]) -> Sequence[IDType]:
+        """Create multiple records without building ORM instances.
+
+        Use for large imports where only the new primary keys are needed.
+
+        Args:
+            items: Field value dicts (any iterable; consumed in chunks)
+
+        Returns:
+            Primary keys of created records, in input order
+        """
+        ids: list[IDType] = []
+        use_returning = self.session.get_bind().dialect.insert_executemany_returning
+        try:
+            if use_returning:
+                stmt = insert(self.model).returning(  # type: ignore[attr-defined]
+                    self.model.id, sort_by_parameter_order=True
+                )
+                for chunk in self._chunk_rows(items):
+                    result = await self.session.execute(stmt, chunk)
+                    ids.extend(result.scalars())
+            else:
+                # No RETURNING (MySQL/MariaDB): one INSERT per row to read its new key
+                table = self.model.__table__  # type: ignore[attr-defined]
+                for row in items:
+                    result = await self.session.execute(insert(table).values(**row))
+                    ids.append(result.inserted_primary_key[0])
+        except IntegrityError:
+            await self.session.rollback()
+            raise
+        except SQLAlchemyError:
+            await self.session.rollback()
+            raise
+        else:
+            return ids
+
+    async def copy_many(self, items: Iterable[dict[str, Any]]) -> int:
+        """Load many records, using PostgreSQL COPY on asyncpg for large batches.
+
+        COPY skips per-row statement execution and ORM bookkeeping entirely.
+        Every row must have the same keys; Python-side column defaults fill the
+        other columns (callables are evaluated per row, without an execution
+        context, so context-sensitive defaults are not supported). Batches
+        smaller than _COPY_MIN_ROWS, or other drivers, fall back to an
+        executemany INSERT.
+
+        Args:
+            items: Field value dicts sharing the same keys
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            ValueError: If the rows do not all have the same keys
+        """
+        rows = [dict(item) for item in items]
+        if not rows:
+            return 0
+        keys = rows[0].keys()
+        if any(row.keys() != keys for row in rows):
+            # Both COPY and executemany take the column list from the first row
+            msg = "copy_many rows must all have the same keys"
+            raise ValueError(msg)
+
+        table = self.model.__table__  # type: ignore[attr-defined]
+        try:
+            conn = await self.session.connection()
+            if len(rows) >= self._COPY_MIN_ROWS and conn.dialect.driver == "asyncpg":
+                columns, records = _copy_records(table, rows)
+                raw = await conn.get_raw_connection()
+                await raw.driver_connection.copy_records_to_table(
+                    table.name, records=records, columns=columns, schema_name=table.schema
+                )
+            else:
+                stmt = insert(table)
+                for start in range(0, len(rows), self._INSERT_CHUNK_SIZE):
+                    await conn.execute(stmt, rows[start : start + self._INSERT_CHUNK_SIZE])
+        except Exception:
+            # COPY raises driver errors that SQLAlchemy does not wrap
+            await self.session.rollback()
+            raise
+        else:
+            return len(rows)
+
     async def get_by_id(self, id: IDType) -> ModelType | None:
         """Get record by ID.
 
@@ -107,24 +648,24 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
 
         Returns:
             Instance or None
+
+        Note:
+            Served from the session identity map without SQL when already loaded
         """
-        result = await self.session.execute(select(self.model).where(self.model.id == id))  # type: ignore[attr-defined]
-        return result.scalar_one_or_none()
+        return await self.session.get(self.model, id, options=self._load_options())
 
     async def get_by(self, **filters: Any) -> ModelType | None:
-        """Get single record by filters.
+        """Get first record matching filters.
 
         Args:
-            **filters: Field-value pairs
+            **filters: Field-value pairs (relationship attributes take an instance)
 
         Returns:
-            Instance or None
+            Instance or None (first match if several rows qualify)
         """
-        query = select(self.model)
-        for field, value in filters.items():
-            query = query.where(getattr(self.model, field) == value)
-        result = await self.session.execute(query)
-        return result.scalar_one_or_none()
+        stmt, params = self._select("select", filters, limit=1)
+        result = await self.session.execute(stmt, params)
+        return result.scalars().first()
 
     async def get_all(
         self,
@@ -144,18 +685,8 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             List of instances
         """
-        query = select(self.model)
-
-        if order_by is not None:
-            col = getattr(self.model, order_by)
-            query = query.order_by(desc(col) if order_desc else asc(col))
-
-        if offset is not None:
-            query = query.offset(offset)
-        if limit is not None:
-            query = query.limit(limit)
-
-        result = await self.session.execute(query)
+        stmt, params = self._select("select", {}, limit, offset, order_by, order_desc)
+        result = await self.session.execute(stmt, params)
         return result.scalars().all()
 
     async def filter(
@@ -178,41 +709,100 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             List of instances
         """
-        query = select(self.model)
+        stmt, params = self._select("select", filters, limit, offset, order_by, order_desc)
+        result = await self.session.execute(stmt, params)
+        return result.scalars().all()
+
+    async def get_all_rows(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order_by: str | None = None,
+        order_desc: bool = False,
+        columns: Sequence[str] = (),
+        **filters: Any,
+    ) -> Sequence[RowMapping]:
+        """Get records as plain row mappings, bypassing ORM instance construction.
 
-        for field, value in filters.items():
-            query = query.where(getattr(self.model, field) == value)
+        Prefer this over get_all/filter for read-only listings that are
+        serialized straight to the response.
 
-        if order_by is not None:
-            col = getattr(self.model, order_by)
-            query = query.order_by(desc(col) if order_desc else asc(col))
+        Args:
+            limit: Max records
+            offset: Records to skip
+            order_by: Column name to sort by
+            order_desc: Sort descending if True
+            columns: Only select these columns (all if empty)
+            **filters: Field-value pairs
 
-        if offset is not None:
-            query = query.offset(offset)
-        if limit is not None:
-            query = query.limit(limit)
+        Returns:
+            List of dict-like rows keyed by column name
+        """
+        stmt, params = self._select("rows", filters, limit, offset, order_by, order_desc, columns)
+        result = await self.session.execute(stmt, params)
+        return result.mappings().all()
 
-        result = await self.session.execute(query)
-        return result.scalars().all()
+    async def stream_rows(
+        self,
+        limit: int | None = None,
+        offset: int | None = None,
+        order_by: str | None = None,
+        order_desc: bool = False,
+        columns: Sequence[str] = (),
+        **filters: Any,
+    ) -> AsyncIterator[RowMapping]:
+        """Stream records as row mappings through a server-side cursor.
+
+        Rows are fetched _STREAM_YIELD_PER at a time, so memory stays flat for
+        large exports regardless of limit. Iterate it fully (or close it) while
+        the session is open.
+
+        Args:
+            limit: Max records
+            offset: Records to skip
+            order_by: Column name to sort by
+            order_desc: Sort descending if True
+            columns: Only select these columns (all if empty)
+            **filters: Field-value pairs
+
+        Yields:
+            Dict-like rows keyed by column name
+        """
+        stmt, params = self._select("rows", filters, limit, offset, order_by, order_desc, columns)
+        result = await self.session.stream(
+            stmt, params, execution_options={"yield_per": self._STREAM_YIELD_PER}
+        )
+        try:
+            async for row in result.mappings():
+                yield row
+        finally:
+            # Release the server-side cursor even if the caller stops early
+            await result.close()
 
     async def update(self, id: IDType, refresh: bool = True, **kwargs: Any) -> ModelType | None:
         """Update record by ID.
 
         Args:
             id: Primary key
-            refresh: Return updated instance
+            refresh: Return updated instance (via RETURNING in the same statement where
+                supported, else a follow-up lookup)
             **kwargs: Fields to update
 
         Returns:
             Updated instance or None
         """
+        # MySQL/MariaDB have no UPDATE ... RETURNING: re-read the row instead
+        use_returning = refresh and self.session.get_bind().dialect.update_returning
         try:
-            result = await self.session.execute(
-                update(self.model).where(self.model.id == id).values(**kwargs)  # type: ignore[attr-defined]
-            )
-            await self.session.flush()
+            stmt = update(self.model).where(self.model.id == id).values(**kwargs)  # type: ignore[attr-defined]
+            if use_returning:
+                stmt = stmt.returning(self.model)  # type: ignore[assignment]
+
+            result = await self.session.execute(stmt)
 
-            if refresh and result.rowcount > 0:  # type: ignore[attr-defined]
+            if use_returning:
+                return result.scalar_one_or_none()  # type: ignore[no-any-return]
+            if refresh:
                 return await self.get_by_id(id)
 
         except IntegrityError:
@@ -234,11 +824,18 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             Number updated
         """
+        updated = 0
+        # Count via RETURNING id where supported; rowcount is not reliable on every DBAPI
+        use_returning = self.session.get_bind().dialect.update_returning
         try:
-            result = await self.session.execute(
-                update(self.model).where(self.model.id.in_(ids)).values(**kwargs)  # type: ignore[attr-defined]
-            )
-            await self.session.flush()
+            for chunk in self._chunk_ids(ids):
+                stmt = update(self.model).where(self.model.id.in_(chunk)).values(**kwargs)  # type: ignore[attr-defined]
+                if use_returning:
+                    result = await self.session.execute(stmt.returning(self.model.id))  # type: ignore[attr-defined]
+                    updated += len(result.scalars().all())
+                else:
+                    result = await self.session.execute(stmt)
+                    updated += result.rowcount  # type: ignore[attr-defined]
         except IntegrityError:
             await self.session.rollback()
             raise
@@ -246,7 +843,7 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
             await self.session.rollback()
             raise
         else:
-            return result.rowcount  # type: ignore[attr-defined, no-any-return]
+            return updated
 
     async def delete(self, id: IDType) -> bool:
         """Delete record by ID.
@@ -259,7 +856,6 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         """
         try:
             result = await self.session.execute(delete(self.model).where(self.model.id == id))  # type: ignore[attr-defined]
-            await self.session.flush()
 
         except IntegrityError:
             await self.session.rollback()
@@ -279,9 +875,18 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             Number deleted
         """
+        deleted = 0
+        # Count via RETURNING id where supported; rowcount is not reliable on every DBAPI
+        use_returning = self.session.get_bind().dialect.delete_returning
         try:
-            result = await self.session.execute(delete(self.model).where(self.model.id.in_(ids)))  # type: ignore[attr-defined]
-            await self.session.flush()
+            for chunk in self._chunk_ids(ids):
+                stmt = delete(self.model).where(self.model.id.in_(chunk))  # type: ignore[attr-defined]
+                if use_returning:
+                    result = await self.session.execute(stmt.returning(self.model.id))  # type: ignore[attr-defined]
+                    deleted += len(result.scalars().all())
+                else:
+                    result = await self.session.execute(stmt)
+                    deleted += result.rowcount  # type: ignore[attr-defined]
         except IntegrityError:
             await self.session.rollback()
             raise
@@ -289,7 +894,7 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
             await self.session.rollback()
             raise
         else:
-            return result.rowcount  # type: ignore[attr-defined, no-any-return]
+            return deleted
 
     async def soft_delete(self, id: IDType) -> bool:
         """Soft delete by setting deleted_at timestamp.
@@ -303,16 +908,14 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Note:
             Requires 'deleted_at' field on model
         """
+        if not self._supports_soft_delete:
+            msg = f"{self.model.__name__} does not support soft delete (missing 'deleted_at' field)"
+            raise AttributeError(msg)
 
         try:
-            if not hasattr(self.model, "deleted_at"):
-                msg = f"{self.model.__name__} does not support soft delete (missing 'deleted_at' field)"
-                raise AttributeError(msg)
-
             result = await self.session.execute(
                 update(self.model).where(self.model.id == id).values(deleted_at=datetime.now(UTC))  # type: ignore[attr-defined]
             )
-            await self.session.flush()
         except SQLAlchemyError:
             await self.session.rollback()
             raise
@@ -328,8 +931,9 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             True if exists
         """
-        result = await self.session.execute(select(self.model.id).where(self.model.id == id_))  # type: ignore[attr-defined]
-        return result.scalar_one_or_none() is not None
+        stmt = _exists_statement(self.model)
+        result = await self.session.execute(stmt, {"filter_id": id_})
+        return result.first() is not None
 
     async def count(self, **filters: Any) -> int:
         """Count records.
@@ -340,13 +944,9 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         Returns:
             Total count
         """
-        query = select(func.count()).select_from(self.model)  # type: ignore[arg-type]
-
-        for field, value in filters.items():
-            query = query.where(getattr(self.model, field) == value)
-
-        result = await self.session.execute(query)
-        return result.scalar_one()  # type: ignore[return-value]
+        stmt, params = self._select("count", filters)
+        result = await self.session.execute(stmt, params)
+        return result.scalar_one()  # type: ignore[no-any-return]
 
     async def commit(self) -> None:
         """Commit current transaction."""
@@ -360,6 +960,50 @@ class BaseRepository(Generic[ModelType, IDType], ABC):
         """Rollback current transaction."""
         await self.session.rollback()
 
+    async def get_page_after(
+        self,
+        after: tuple[Any, IDType] | None = None,
+        size: int = 20,
+        order_by: str = "id",
+        order_desc: bool = False,
+        **filters: Any,
+    ) -> Sequence[ModelType]:
+        """Get the page following a cursor (keyset pagination).
+
+        Cost stays constant however deep the page, unlike get_page's OFFSET.
+        Pass the last row's ``(getattr(row, order_by), row.id)`` as the next
+        cursor. Back it with an index on (order_by, id) for large tables.
+
+        Args:
+            after: (order_by value, id) of the previous page's last row; None for
+                the first page
+            size: Items per page
+            order_by: Column name to sort by (id breaks ties)
+            order_desc: Sort descending if True
+            **filters: Field-value pairs
+
+        Returns:
+            Up to ``size`` instances
+        """
+        bound, criteria = self._split_filters(filters)
+        stmt = _seek_statement(
+            self.model,
+            tuple((field, value is None) for field, value in bound.items()),
+            order_by,
+            order_desc,
+            after is not None,
+            self._load_options(),
+        )
+        if criteria:
+            stmt = stmt.where(*criteria)
+
+        params = {f"filter_{field}": value for field, value in bound.items() if value is not None}
+        params["page_limit"] = size
+        if after is not None:
+            params["after_value"], params["after_id"] = after
+        result = await self.session.execute(stmt, params)
+        return result.scalars().all()
+
     async def get_page(
         self,
         page: int = 1,
@@ -1,52 +1,111 @@
 """Environment detection and .env file selection utilities."""
 
 import os
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+from pydantic_settings import DotEnvSettingsSource
 
 from app.core.enums import Environment
 
-__all__ = ["Environment", "get_current_environment", "get_env_file", "get_env_files"]
+__all__ = [
+    "CachedDotEnvSettingsSource",
+    "Environment",
+    "clear_cache",
+    "get_current_environment",
+    "get_env_file",
+    "get_env_files",
+]
 
 # Get the directory where this file is located (app/core/)
 _CURRENT_DIR = Path(__file__).parent
 # Navigate to app/env_files/ directory
 _ENV_FILES_DIR = _CURRENT_DIR.parent / "env_files"
 
+_ENV_BY_VALUE: dict[str, Environment] = {env.value: env for env in Environment}
+
+# All possible .env paths, resolved once at import
+_BASE_ENV_FILE = str(_ENV_FILES_DIR / ".env_base")
+_ENV_FILE_PATHS: dict[Environment, str] = {
+    env: str(_ENV_FILES_DIR / f".env_{env.value}") for env in Environment
+}
+_ENV_FILE_SETS: dict[Environment, tuple[str, str]] = {
+    env: (_BASE_ENV_FILE, path) for env, path in _ENV_FILE_PATHS.items()
+}
+
+
+# Parsed .env contents shared by every settings class, keyed by files + parse options
+_DOTENV_CACHE: dict[tuple[object, ...], Mapping[str, str | None]] = {}
+
+
+class CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """Dotenv source that parses each set of .env files once per process.
+
+    Every BaseSettings class otherwise re-opens and re-parses the same files;
+    prefixes and field matching still run per class on the shared mapping.
+    """
+
+    def _load_env_vars(self) -> Mapping[str, str | None]:
+        env_files = self.env_file
+        if env_files is None or isinstance(env_files, (str, os.PathLike)):
+            env_files = (env_files,)
+        key = (
+            tuple(env_files),
+            self.env_file_encoding,
+            self.case_sensitive,
+            self.env_ignore_empty,
+            self.env_parse_none_str,
+        )
+        env_vars = _DOTENV_CACHE.get(key)
+        if env_vars is None:
+            env_vars = _DOTENV_CACHE[key] = MappingProxyType(dict(super()._load_env_vars()))
+        return env_vars
+
 
 def _normalize_environment_value(value: str | None) -> str:
     """Normalize environment input from env vars or overrides."""
     return (value or Environment.LOCAL.value).strip().lower()
 
 
+@lru_cache(maxsize=1)
 def get_current_environment() -> Environment:
-    """Get current environment from ENV variable (defaults to LOCAL)."""
+    """Get current environment from ENV variable (defaults to LOCAL).
+
+    ENV is read once and cached for the process; call clear_cache() to re-read.
+    """
     env_value = _normalize_environment_value(os.getenv("ENV", Environment.LOCAL.value))
-    try:
-        return Environment(env_value)
-    except ValueError:
-        return Environment.LOCAL
+    return _ENV_BY_VALUE.get(env_value, Environment.LOCAL)
 
 
-def get_env_file(override: Environment | None = None) -> str:
-    """Absolute path to the environment-specific .env file."""
-    env = _normalize_environment_value(os.getenv("ENV", Environment.LOCAL.value))
+def _resolve_environment(override: Environment | None) -> Environment:
+    """Current environment, with override honored only in local mode (for testing)."""
+    env = get_current_environment()
+    if env is Environment.LOCAL and override:
+        return override
+    return env
 
-    # Allow override only in local environment for testing
-    if env == Environment.LOCAL.value and override:
-        env = override.value
 
-    return str(_ENV_FILES_DIR / f".env_{env}")
+def get_env_file(override: Environment | None = None) -> str:
+    """Absolute path to the environment-specific .env file."""
+    return _ENV_FILE_PATHS[_resolve_environment(override)]
 
 
-def get_env_files(override: Environment | None = None) -> list[str]:
+def get_env_files(override: Environment | None = None) -> tuple[str, str]:
     """Get .env files to load (base + environment-specific).
 
     Args:
         override: Override environment (local mode only)
 
     Returns:
-        List of absolute .env file paths in load order (base first, then environment-specific)
+        Shared tuple of absolute .env file paths in load order (base first, then
+        environment-specific)
     """
-    env_specific = get_env_file(override)
-    base_file = str(_ENV_FILES_DIR / ".env_base")
-    return [base_file, env_specific]
+    return _ENV_FILE_SETS[_resolve_environment(override)]
+
+
+def clear_cache() -> None:
+    """Reset cached lookups so the next call re-reads ENV and .env files (for tests)."""
+    get_current_environment.cache_clear()
+    _DOTENV_CACHE.clear()
@@ -1,9 +1,9 @@
 """Async SQLAlchemy connection pool and session management.
 
 Features:
-    - Singleton connection pool manager
+    - Process-wide connection pool (module-level state, initialized once at startup)
     - Async-only operations
-    - Connection pooling with health checks
+    - Connection pooling with health checks and LIFO checkout
     - Automatic session cleanup and rollback
 
 Usage:
@@ -19,10 +19,17 @@ Usage:
     await AsyncDBPool.dispose()
 """
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import asyncio
+import functools
+import logging
+from collections.abc import Awaitable, Callable
+from types import TracebackType
+from typing import ParamSpec, TypeVar
 
+from sqlalchemy import AsyncAdaptedQueuePool, text
+from sqlalchemy.exc import DBAPIError, DisconnectionError
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -32,10 +39,254 @@ from sqlalchemy.ext.asyncio import (
 # Import DatabaseConfig from main_config
 from app.main_config import DatabaseConfig
 
+__all__ = [
+    "AsyncDBPool",
+    "dispose_db",
+    "get_session",
+    "get_sessionmaker",
+    "init_db",
+    "retry_read_on_disconnect",
+]
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# =============================================================================
+# Pool State (using container pattern to avoid 'global' statement)
+# =============================================================================
+
+# Engine and sessionmaker are stored together so they are swapped in one assignment
+_Pool = tuple[AsyncEngine, async_sessionmaker[AsyncSession]]
+_state: dict[str, _Pool | None] = {"pool": None}
+
+
+async def init_db(config: DatabaseConfig, workers: int = 1) -> None:
+    """Initialize async engine and sessionmaker.
+
+    Args:
+        config: Database configuration
+        workers: Server worker processes, each opening its own pool
+    """
+    if _state["pool"] is not None:
+        return  # already initialized
+
+    # Only pass valid SQLAlchemy engine parameters
+    engine = create_async_engine(
+        config.url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        pool_pre_ping=config.pool_pre_ping,
+        pool_use_lifo=config.pool_use_lifo,
+        echo=config.echo,
+        query_cache_size=config.query_cache_size,
+        connect_args=config.connect_args,
+    )
+    _state["pool"] = (
+        engine,
+        async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession),
+    )
+    _check_pool_capacity(config, workers)
+    if config.pool_warmup:
+        await _warm_pool(engine, config.pool_size, config.pool_warmup_timeout)
+
+
+async def _open_checked(engine: AsyncEngine) -> AsyncConnection:
+    """Check out a connection and verify it with a round-trip."""
+    conn = await engine.connect()
+    try:
+        await conn.execute(text("SELECT 1"))
+    except BaseException:
+        await conn.close()
+        raise
+    return conn
+
+
+async def _warm_pool(engine: AsyncEngine, size: int, timeout: float) -> None:
+    """Open `size` connections up front so first requests skip connect/auth.
+
+    The first connection runs the dialect's one-time initialization alone; the
+    rest connect concurrently and are held together so the pool creates
+    distinct ones, then all are returned. Each phase gets `timeout` seconds, so
+    an unreachable database does not hold startup for the driver's connect
+    timeout. Failures are logged, not raised; the pool connects lazily.
+    """
+    try:
+        first = await asyncio.wait_for(_open_checked(engine), timeout)
+    except Exception:
+        logger.warning("Database pool warm-up failed; connecting lazily", exc_info=True)
+        return
+
+    tasks = [asyncio.create_task(_open_checked(engine)) for _ in range(size - 1)]
+    if tasks:
+        # Cancel stragglers instead of abandoning them: opened connections are closed
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    conns = [first, *(r for r in results if isinstance(r, AsyncConnection))]
+    await asyncio.gather(*(conn.close() for conn in conns))
+
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        logger.warning(
+            "Database pool warm-up opened %d of %d connections",
+            len(conns),
+            size,
+            exc_info=errors[0],
+        )
+
+
+def _check_pool_capacity(config: DatabaseConfig, workers: int = 1) -> None:
+    """Warn when pools are too small for the load or too large for the server.
+
+    Each worker process owns its pool; once pool_size + max_overflow connections
+    are checked out, further requests block on checkout for pool_timeout seconds.
+    Across workers, the pools together must stay within the server's connection
+    limit, or new connections are refused.
+    """
+    capacity = config.pool_size + config.max_overflow
+    total = capacity * workers
+    logger.info(
+        "Database pool capacity %d per worker, %d across %d worker(s) "
+        "(pool_size=%d, max_overflow=%d)",
+        capacity,
+        total,
+        workers,
+        config.pool_size,
+        config.max_overflow,
+    )
+    if total > config.max_server_connections:
+        logger.warning(
+            "Database pools may open %d connections across %d worker(s), above the "
+            "server limit of %d; lower DATABASE_POOL_SIZE/DATABASE_MAX_OVERFLOW or "
+            "raise DATABASE_MAX_SERVER_CONNECTIONS to match max_connections",
+            total,
+            workers,
+            config.max_server_connections,
+        )
+    if capacity < config.expected_concurrency:
+        logger.warning(
+            "Database pool capacity %d is below expected concurrency %d per worker; "
+            "raise DATABASE_POOL_SIZE or DATABASE_MAX_OVERFLOW",
+            capacity,
+            config.expected_concurrency,
+        )
+
+
+async def dispose_db() -> None:
+    """Close all database connections and cleanup."""
+    pool = _state["pool"]
+    if pool is not None:
+        _state["pool"] = None
+        await pool[0].dispose()
+
+
+def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the initialized sessionmaker.
+
+    Raises:
+        RuntimeError: If the pool has not been initialized
+    """
+    pool = _state["pool"]
+    if pool is None:
+        msg = "AsyncDBPool not initialized. Call await AsyncDBPool.init() first."
+        raise RuntimeError(msg)
+    return pool[1]
+
+
+class _SessionContext:
+    """Async context manager yielding a session, rolled back on errors.
+
+    Hand-written instead of @asynccontextmanager to skip the generator wrapper
+    and its extra frames on every session checkout.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self) -> None:
+        self._session: AsyncSession | None = None
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = get_sessionmaker()()
+        return self._session
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        session = self._session
+        self._session = None
+        if session is None:
+            return
+        try:
+            if exc_type is not None and issubclass(exc_type, Exception):
+                await session.rollback()
+        finally:
+            await session.close()
+
+
+def get_session() -> _SessionContext:
+    """Get database session with automatic rollback on errors.
+
+    Usage:
+        async with get_session() as session:
+            await session.execute(...)
+            await session.commit()
+    """
+    return _SessionContext()
+
+
+def _is_disconnect(exc: Exception) -> bool:
+    """Check whether an error means the pooled connection was stale."""
+    if isinstance(exc, DisconnectionError):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
+def retry_read_on_disconnect(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+    """Retry a read-only unit of work once when its connection was dropped by the server.
+
+    With pool_pre_ping disabled, a checkout can return a connection the server
+    already closed; SQLAlchemy invalidates it and raises. The wrapped callable
+    must open its own session so the retry runs on a fresh connection.
+
+    Only wrap idempotent, read-only work: a disconnect can surface after the
+    server already applied (or committed) a write, so replaying it may apply
+    the write twice.
+
+    Usage:
+        @retry_read_on_disconnect
+        async def load_events() -> list[Event]:
+            async with get_session() as session:
+                return list((await session.scalars(select(Event))).all())
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        try:
+            return await func(*args, **kwargs)
+        except (DBAPIError, DisconnectionError) as exc:
+            if not _is_disconnect(exc):
+                raise
+            logger.warning("Retrying after stale database connection: %s", exc)
+            return await func(*args, **kwargs)
+
+    return wrapper
+
 
 class AsyncDBPool:
     """Async SQLAlchemy connection pool manager.
 
+    Thin namespace over the module-level pool functions; state lives at module
+    level so the per-request path avoids classmethod dispatch.
+
     Usage:
         await AsyncDBPool.init(config)
         async with AsyncDBPool.get_session() as session:
@@ -43,59 +294,6 @@ class AsyncDBPool:
         await AsyncDBPool.dispose()
     """
 
-    _engine: AsyncEngine | None = None
-    _maker: async_sessionmaker[AsyncSession] | None = None
-
-    @classmethod
-    async def init(
-        cls,
-        config: DatabaseConfig,
-    ) -> None:
-        """Initialize async engine and sessionmaker.
-
-        Args:
-            config: Database configuration
-        """
-        if cls._engine is not None:
-            return  # already initialized
-
-        # Only pass valid SQLAlchemy engine parameters
-        cls._engine = create_async_engine(
-            config.url,
-            pool_size=config.pool_size,
-            max_overflow=config.max_overflow,
-            pool_timeout=config.pool_timeout,
-            pool_recycle=config.pool_recycle,
-            pool_pre_ping=config.pool_pre_ping,
-            echo=config.echo,
-        )
-        cls._maker = async_sessionmaker(cls._engine, expire_on_commit=False, class_=AsyncSession)
-
-    @classmethod
-    async def dispose(cls) -> None:
-        """Close all database connections and cleanup."""
-        if cls._engine is not None:
-            await cls._engine.dispose()
-            cls._engine = None
-            cls._maker = None
-
-    @classmethod
-    @asynccontextmanager
-    async def get_session(cls) -> AsyncIterator[AsyncSession]:
-        """Get database session with automatic rollback on errors.
-
-        Usage:
-            async with AsyncDBPool.get_session() as session:
-                await session.execute(...)
-                await session.commit()
-        """
-        if cls._maker is None:
-            msg = "AsyncDBPool not initialized. Call await AsyncDBPool.init() first."
-            raise RuntimeError(msg)
-
-        async with cls._maker() as session:
-            try:
-                yield session
-            except Exception:
-                await session.rollback()
-                raise
+    init = staticmethod(init_db)
+    dispose = staticmethod(dispose_db)
+    get_session = staticmethod(get_session)
@@ -14,7 +14,7 @@ from collections.abc import AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .database import AsyncDBPool
+from .database import get_sessionmaker
 
 
 async def get_db() -> AsyncIterator[AsyncSession]:
@@ -26,5 +26,13 @@ async def get_db() -> AsyncIterator[AsyncSession]:
             result = await db.execute(select(Event))
             return result.scalars().all()
     """
-    async with AsyncDBPool.get_session() as session:
+    # Acquire the session inline instead of nesting get_session()'s context
+    # manager, saving one generator frame and __aenter__/__aexit__ per request.
+    session = get_sessionmaker()()
+    try:
         yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -4,19 +4,51 @@ Provides centralized exception handling with standardized error responses.
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from fastapi import Request, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from sqlalchemy.exc import IntegrityError
 
 from .http_exceptions import AppError, ErrorResponse, InternalServerError
 
 logger = logging.getLogger(__name__)
 
+# Constant parts of the handler payloads; each error copies in detail/path
+_VALIDATION_TEMPLATE = ErrorResponse.model_construct(
+    error_code="ValidationError",
+    message="Request validation failed",
+)
+_INTEGRITY_TEMPLATE = ErrorResponse.model_construct(
+    error_code="IntegrityError",
+    message="Database constraint violation",
+)
+_INTERNAL_TEMPLATE = ErrorResponse.model_construct(
+    error_code=InternalServerError.__name__,
+    message="An unexpected error occurred",
+)
 
-async def app_exception_handler(request: Request, exc: AppError) -> JSONResponse:
+
+def _error_json_response(error_response: ErrorResponse, status_code: int) -> Response:
+    """Serialize an error response with Pydantic's compiled JSON serializer.
+
+    Args:
+        error_response: Error payload
+        status_code: HTTP status code
+
+    Returns:
+        JSON response without an intermediate dict round-trip
+    """
+    return Response(
+        content=error_response.model_dump_json(exclude_none=True),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+async def app_exception_handler(request: Request, exc: AppError) -> Response:
     """Handle custom AppException and its subclasses.
 
     Args:
@@ -26,17 +58,12 @@ async def app_exception_handler(request: Request, exc: AppError) -> JSONResponse
     Returns:
         JSON response with standardized error format
     """
-    error_response = exc.to_error_response(path=request.url.path)
+    error_response = exc.to_error_response(path=request.scope["path"])
 
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=error_response.model_dump(exclude_none=True),
-    )
+    return _error_json_response(error_response, exc.status_code)
 
 
-async def validation_exception_handler(
-    request: Request, exc: RequestValidationError
-) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
     """Handle Pydantic validation errors (422).
 
     Args:
@@ -46,20 +73,14 @@ async def validation_exception_handler(
     Returns:
         JSON response with validation error details
     """
-    error_response = ErrorResponse(
-        error_code="ValidationError",
-        message="Request validation failed",
-        detail={"errors": exc.errors()},
-        path=request.url.path,
+    error_response = _VALIDATION_TEMPLATE.model_copy(
+        update={"detail": {"errors": exc.errors()}, "path": request.scope["path"]}
     )
 
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
-        content=error_response.model_dump(exclude_none=True),
-    )
+    return _error_json_response(error_response, status.HTTP_422_UNPROCESSABLE_CONTENT)
 
 
-async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSONResponse:
+async def integrity_error_handler(request: Request, exc: IntegrityError) -> Response:
     """Handle SQLAlchemy IntegrityError (database constraints).
 
     Args:
@@ -69,21 +90,14 @@ async def integrity_error_handler(request: Request, exc: IntegrityError) -> JSON
     Returns:
         JSON response with constraint violation details
     """
-    logger.error("Database integrity error: %s", exc, exc_info=True)
+    logger.exception("Database integrity error: %s", exc)
 
-    error_response = ErrorResponse(
-        error_code="IntegrityError",
-        message="Database constraint violation",
-        path=request.url.path,
-    )
+    error_response = _INTEGRITY_TEMPLATE.model_copy(update={"path": request.scope["path"]})
 
-    return JSONResponse(
-        status_code=status.HTTP_409_CONFLICT,
-        content=error_response.model_dump(exclude_none=True),
-    )
+    return _error_json_response(error_response, status.HTTP_409_CONFLICT)
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle unexpected exceptions (500).
 
     Args:
@@ -93,19 +107,22 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     Returns:
         JSON response with generic error message
     """
-    logger.error("Unexpected error: %s", exc, exc_info=True)
+    logger.exception("Unexpected error: %s", exc)
 
-    # Convert to internal server exception
-    internal_exc = InternalServerError(
-        message="An unexpected error occurred",
-    )
+    error_response = _INTERNAL_TEMPLATE.model_copy(update={"path": request.scope["path"]})
 
-    error_response = internal_exc.to_error_response(path=request.url.path)
+    return _error_json_response(error_response, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    return JSONResponse(
-        status_code=internal_exc.status_code,
-        content=error_response.model_dump(exclude_none=True),
-    )
+
+# Starlette resolves handlers by dict lookup along type(exc).__mro__, so each
+# class gets its own entry. Exception must stay separate: it is served by
+# ServerErrorMiddleware, while the others run inside ExceptionMiddleware.
+_EXCEPTION_HANDLERS: tuple[tuple[type[Exception], Callable[..., Awaitable[Response]]], ...] = (
+    (AppError, app_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (IntegrityError, integrity_error_handler),
+    (Exception, generic_exception_handler),
+)
 
 
 def register_exception_handlers(app: Any) -> None:
@@ -114,7 +131,5 @@ def register_exception_handlers(app: Any) -> None:
     Args:
         app: FastAPI application instance
     """
-    app.add_exception_handler(AppError, app_exception_handler)
-    app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(IntegrityError, integrity_error_handler)
-    app.add_exception_handler(Exception, generic_exception_handler)
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
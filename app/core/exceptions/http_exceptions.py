@@ -26,10 +26,11 @@ Usage:
         message="User not found",
         detail={"user_id": 123}
     )
-    raise NotFoundError(error)
+    raise NotFoundError.from_response(error)
 """
 
-from typing import Any
+import warnings
+from typing import Any, Self
 
 from fastapi import HTTPException, status
 from pydantic import BaseModel, Field
@@ -55,22 +56,44 @@ class AppError(HTTPException):
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail: dict[str, Any] | None = None,
     ) -> None:
-        # Handle ErrorResponse object
         if isinstance(message, ErrorResponse):
-            error_response = message
-            self.message = error_response.message
-            self.error_code = error_response.error_code
-            self.error_detail = error_response.detail
-            # Use provided status_code or default
-            actual_status_code = status_code
-        else:
-            # Handle individual parameters
-            self.message = message
-            self.error_code = error_code or self.__class__.__name__
-            self.error_detail = detail
-            actual_status_code = status_code
-
-        super().__init__(status_code=actual_status_code, detail=self.message)
+            name = type(self).__name__
+            warnings.warn(
+                f"Passing an ErrorResponse to {name}() is deprecated; use {name}.from_response()",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            error_code = error_code or message.error_code
+            detail = message.detail if detail is None else detail
+            message = message.message
+        elif not isinstance(message, str):
+            msg = f"{type(self).__name__} message must be a str, got {type(message).__name__}"
+            raise TypeError(msg)
+        self.message = message
+        self.error_code = error_code or self.__class__.__name__
+        self.error_detail = detail
+
+        super().__init__(status_code=status_code, detail=message)
+
+    @classmethod
+    def from_response(cls, error_response: ErrorResponse, status_code: int | None = None) -> Self:
+        """Build the exception from an existing ErrorResponse.
+
+        Args:
+            error_response: Error payload to raise
+            status_code: Override for the class's default status code
+
+        Returns:
+            Exception instance carrying the response fields
+        """
+        exc = cls(
+            error_response.message,
+            error_code=error_response.error_code,
+            detail=error_response.detail,
+        )
+        if status_code is not None:
+            exc.status_code = status_code
+        return exc
 
     def to_error_response(self, path: str | None = None) -> ErrorResponse:
         """Convert exception to ErrorResponse object.
@@ -81,7 +104,8 @@ class AppError(HTTPException):
         Returns:
             ErrorResponse object
         """
-        return ErrorResponse(
+        # Fields were validated when the exception was built; skip re-validation
+        return ErrorResponse.model_construct(
             error_code=self.error_code,
             message=self.message,
             detail=self.error_detail,
@@ -99,7 +123,7 @@ class ClientError(AppError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Client error",
+        message: str = "Client error",
         error_code: str | None = None,
         status_code: int = status.HTTP_400_BAD_REQUEST,
         detail: dict[str, Any] | None = None,
@@ -112,7 +136,7 @@ class BadRequestError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Bad request",
+        message: str = "Bad request",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -124,7 +148,7 @@ class UnauthorizedError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Unauthorized",
+        message: str = "Unauthorized",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -136,7 +160,7 @@ class ForbiddenError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Forbidden",
+        message: str = "Forbidden",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -148,7 +172,7 @@ class NotFoundError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Not found",
+        message: str = "Not found",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -160,7 +184,7 @@ class ConflictError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Conflict",
+        message: str = "Conflict",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -172,7 +196,7 @@ class UnprocessableEntityError(ClientError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Unprocessable entity",
+        message: str = "Unprocessable entity",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -189,7 +213,7 @@ class ServerError(AppError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Server error",
+        message: str = "Server error",
         error_code: str | None = None,
         status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
         detail: dict[str, Any] | None = None,
@@ -202,7 +226,7 @@ class InternalServerError(ServerError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Internal server error",
+        message: str = "Internal server error",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -214,7 +238,7 @@ class NotImplementedAppError(ServerError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Not implemented",
+        message: str = "Not implemented",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
@@ -226,7 +250,7 @@ class ServiceUnavailableError(ServerError):
 
     def __init__(
         self,
-        message: str | ErrorResponse = "Service unavailable",
+        message: str = "Service unavailable",
         error_code: str | None = None,
         detail: dict[str, Any] | None = None,
     ) -> None:
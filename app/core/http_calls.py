@@ -5,6 +5,7 @@ Features:
     - Configurable timeouts and retry logic
     - Keep-alive connection management
     - SSL verification and redirect following
+    - Optional HTTP response caching (ClientConfig(cache=True), needs hishel)
     - Singleton pattern with async-safe operations
 
 Usage:
@@ -18,19 +19,22 @@ Usage:
     # Make requests
     data = await fetch_url("https://api.example.com/data")
 
-    # Or use client directly
-    client = await HttpxRestClientPool.get_client()
+    # Or use client directly (initialized by the lifespan via startup())
+    client = HttpxRestClientPool.client
     response = await client.get("https://api.example.com")
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+import importlib.util
+import logging
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import httpx
 from fastapi import FastAPI
-from pydantic import BaseModel, Field
 
 __all__ = [
     "ClientConfig",
@@ -38,90 +42,199 @@ __all__ = [
     "http_pool_lifespan",
 ]
 
+logger = logging.getLogger(__name__)
 
-class TimeoutConfig(BaseModel):
-    """HTTP client timeout settings."""
+# orjson parses the raw UTF-8 body without decoding it to str first
+_orjson_loads: Callable[[bytes], Any] | None = None
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
 
-    connect: float = Field(default=5.0, description="Connection timeout (seconds)")
-    read: float = Field(default=30.0, description="Read timeout (seconds)")
-    write: float = Field(default=30.0, description="Write timeout (seconds)")
-    pool: float = Field(default=30.0, description="Pool timeout (seconds)")
+    _orjson_loads = orjson.loads
+
+
+@dataclass(frozen=True, slots=True)
+class TimeoutConfig:
+    """HTTP client timeout settings (seconds)."""
+
+    connect: float = 5.0
+    read: float = 30.0
+    write: float = 30.0
+    pool: float = 30.0
 
     def to_httpx_timeout(self) -> httpx.Timeout:
         """Convert to httpx.Timeout."""
-        return httpx.Timeout(**self.model_dump())
+        return httpx.Timeout(connect=self.connect, read=self.read, write=self.write, pool=self.pool)
 
 
-class PoolConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class PoolConfig:
     """Connection pool settings."""
 
-    max_connections: int = Field(default=100, description="Max total connections")
-    max_keepalive: int = Field(default=20, description="Max idle connections")
-    keepalive_expiry: float = Field(default=30.0, description="Idle connection TTL (seconds)")
+    max_connections: int = 100  # Max total connections
+    max_keepalive: int = 20  # Max idle connections
+    keepalive_expiry: float = 30.0  # Idle connection TTL (seconds)
+
+    def to_httpx_limits(self) -> httpx.Limits:
+        """Convert to httpx.Limits."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
 
-class RetryConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RetryConfig:
     """Retry settings for failed requests."""
 
-    max_retries: int = Field(default=3, description="Max retry attempts")
+    max_retries: int = 3  # Max retry attempts
+
+
+@dataclass(frozen=True, slots=True)
+class ClientConfig:
+    """HTTP client configuration.
+
+    Plain frozen dataclasses: values come from application code, not untrusted
+    input, so Pydantic validation would only add startup cost.
+    """
+
+    timeout: TimeoutConfig = field(default_factory=TimeoutConfig)
+    pool: PoolConfig = field(default_factory=PoolConfig)
+    retry: RetryConfig = field(default_factory=RetryConfig)
+    http2: bool = True  # Enable HTTP/2
+    verify_ssl: bool = True  # Verify SSL certificates
+    follow_redirects: bool = True  # Follow redirects
+    cache: bool = False  # Cache responses per HTTP headers (hishel)
+    cache_capacity: int = 1024  # Max cached responses in memory
+
+
+class _AuthBypassTransport(httpx.AsyncBaseTransport):
+    """Send requests carrying Authorization around the shared response cache.
+
+    The cache sits on a process-wide client shared by every caller, so a
+    response fetched with one caller's credentials must never be replayed to
+    another caller of the same URL.
+    """
+
+    def __init__(self, cached: httpx.AsyncBaseTransport, direct: httpx.AsyncBaseTransport) -> None:
+        self._cached = cached
+        self._direct = direct
 
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if "authorization" in request.headers:
+            return await self._direct.handle_async_request(request)
+        return await self._cached.handle_async_request(request)
 
-class ClientConfig(BaseModel):
-    """HTTP client configuration."""
+    async def aclose(self) -> None:
+        # Closing the cache transport also closes the wrapped direct transport
+        await self._cached.aclose()
 
-    timeout: TimeoutConfig = Field(default_factory=TimeoutConfig)
-    pool: PoolConfig = Field(default_factory=PoolConfig)
-    retry: RetryConfig = Field(default_factory=RetryConfig)
-    http2: bool = Field(default=True, description="Enable HTTP/2")
-    verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
-    follow_redirects: bool = Field(default=True, description="Follow redirects")
 
+class _ClientPoolMeta(type):
+    """Exposes the shared client as a synchronous class-level property."""
 
-class HttpxRestClientPool:
-    """Singleton HTTP client pool with connection reuse."""
+    _client: httpx.AsyncClient | None
+
+    @property
+    def client(cls) -> httpx.AsyncClient | None:
+        """Shared client, or None before startup()."""
+        return cls._client
+
+
+class HttpxRestClientPool(metaclass=_ClientPoolMeta):
+    """Singleton HTTP client pool with connection reuse.
+
+    The lifespan calls startup() once; request paths read the synchronous
+    `HttpxRestClientPool.client` instead of awaiting a coroutine per call.
+    """
 
     _client: httpx.AsyncClient | None = None
     _config: ClientConfig = ClientConfig()
-    _lock: asyncio.Lock | None = None
+    # httpx objects built from _config whenever it is set
+    _timeout: httpx.Timeout = _config.timeout.to_httpx_timeout()
+    _limits: httpx.Limits = _config.pool.to_httpx_limits()
+    # One lock per event loop; entries vanish with their loop
+    _locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
 
     @classmethod
     def _get_lock(cls) -> asyncio.Lock:
-        """Get or create lock for event loop."""
-        if cls._lock is None:
-            cls._lock = asyncio.Lock()
-        return cls._lock
+        """Get or create lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+        return lock
 
     @classmethod
     def configure(cls, config: ClientConfig | None = None) -> None:
         """Set client configuration."""
         if config is not None:
             cls._config = config
+            cls._timeout = config.timeout.to_httpx_timeout()
+            cls._limits = config.pool.to_httpx_limits()
+
+    @classmethod
+    def _http2_enabled(cls) -> bool:
+        """HTTP/2 if configured and h2 is installed, else fall back to HTTP/1.1.
+
+        One HTTP/2 connection multiplexes up to min(server limit, 100) streams
+        per host (httpcore's local cap), so fewer keep-alive slots are needed.
+        """
+        if not cls._config.http2:
+            return False
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+            return False
+        return True
+
+    @classmethod
+    def _wrap_cache(cls, transport: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+        """Wrap the transport in an in-memory RFC 7234 cache when enabled.
+
+        Only responses whose headers allow caching are stored; callers can send
+        `Cache-Control: no-cache` to force a round trip. The client is shared
+        across users, so the cache acts as a shared cache: `Cache-Control:
+        private` responses are not stored, only GETs are cached, and requests
+        with an Authorization header bypass it.
+        """
+        if not cls._config.cache:
+            return transport
+        if importlib.util.find_spec("hishel") is None:
+            logger.warning("Response caching requested but 'hishel' is not installed")
+            return transport
+
+        import hishel
+
+        storage = hishel.AsyncInMemoryStorage(capacity=cls._config.cache_capacity)
+        controller = hishel.Controller(cache_private=False, cacheable_methods=["GET"])
+        cached = hishel.AsyncCacheTransport(
+            transport=transport, storage=storage, controller=controller
+        )
+        return _AuthBypassTransport(cached, transport)
+
+    @classmethod
+    async def startup(cls) -> httpx.AsyncClient:
+        """Create the shared HTTP client if needed (async-safe)."""
+        async with cls._get_lock():
+            if cls._client is None:
+                transport = httpx.AsyncHTTPTransport(
+                    retries=cls._config.retry.max_retries,
+                    http2=cls._http2_enabled(),
+                    limits=cls._limits,
+                )
+
+                cls._client = httpx.AsyncClient(
+                    transport=cls._wrap_cache(transport),
+                    timeout=cls._timeout,
+                    verify=cls._config.verify_ssl,
+                    follow_redirects=cls._config.follow_redirects,
+                )
+            return cls._client
 
     @classmethod
     async def get_client(cls) -> httpx.AsyncClient:
-        """Get shared HTTP client (thread-safe)."""
-        if cls._client is None:
-            async with cls._get_lock():
-                if cls._client is None:
-                    limits = httpx.Limits(
-                        max_connections=cls._config.pool.max_connections,
-                        max_keepalive_connections=cls._config.pool.max_keepalive,
-                        keepalive_expiry=cls._config.pool.keepalive_expiry,
-                    )
-
-                    transport = httpx.AsyncHTTPTransport(
-                        retries=cls._config.retry.max_retries,
-                        http2=cls._config.http2,
-                        limits=limits,
-                    )
-
-                    cls._client = httpx.AsyncClient(
-                        transport=transport,
-                        timeout=cls._config.timeout.to_httpx_timeout(),
-                        verify=cls._config.verify_ssl,
-                        follow_redirects=cls._config.follow_redirects,
-                    )
-        return cls._client
+        """Get shared HTTP client, creating it on first use."""
+        return cls._client or await cls.startup()
 
     @classmethod
     async def dispose(cls) -> None:
@@ -129,7 +242,6 @@ class HttpxRestClientPool:
         if cls._client is not None:
             await cls._client.aclose()
             cls._client = None
-            cls._lock = None
 
 
 @asynccontextmanager
@@ -148,7 +260,7 @@ async def http_pool_lifespan(
     if config is not None:
         HttpxRestClientPool.configure(config)
 
-    await HttpxRestClientPool.get_client()
+    await HttpxRestClientPool.startup()
     try:
         yield
     finally:
@@ -174,13 +286,18 @@ async def fetch_url(
     Returns:
         JSON dict if return_json=True, else httpx.Response
     """
-    client = await HttpxRestClientPool.get_client()
+    # Plain attribute read on the hot path; startup() only runs if the lifespan didn't
+    client = HttpxRestClientPool.client
+    if client is None:
+        client = await HttpxRestClientPool.startup()
     response = await client.request(method, url, **kwargs)
 
     if raise_for_status:
         response.raise_for_status()
 
     if return_json:
+        if _orjson_loads is not None:
+            return _orjson_loads(response.content)
         return response.json()
 
     return response
@@ -10,6 +10,8 @@ The lifespan context manager ensures proper resource management
 and graceful shutdown of all application services.
 """
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -17,7 +19,9 @@ from fastapi import FastAPI
 
 from app.core.database import AsyncDBPool
 from app.core.http_calls import HttpxRestClientPool
-from app.main_config import database_config
+from app.main_config import database_config, settings
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
@@ -32,9 +36,14 @@ async def app_lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         - Cleanup database pool
         - Cleanup HTTP client pool
     """
+    # uvicorn installs the loop before the app starts; log which one is serving
+    loop = type(asyncio.get_running_loop())
+    logger.info("Event loop: %s.%s", loop.__module__, loop.__qualname__)
+
     # Startup: Initialize pools
-    await AsyncDBPool.init(database_config)
-    await HttpxRestClientPool.get_client()
+    # uvicorn runs a single process when reloading (see app.main)
+    await AsyncDBPool.init(database_config, workers=1 if settings.reload else settings.workers)
+    await HttpxRestClientPool.startup()
 
     yield
 
@@ -11,10 +11,15 @@ Usage:
     setup_logging()  # Call once at app startup
 """
 
+import atexit
 import importlib.util
+import json
 import logging
+import os
+import queue
 import sys
-from collections.abc import MutableMapping
+from collections.abc import Callable, MutableMapping
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 import structlog
@@ -24,17 +29,94 @@ from app.main_config import logging_config
 
 Processor = structlog.types.Processor
 
+# Background stdout writer and the queue it drains (using container pattern to
+# avoid 'global' statement)
+_state: dict[str, Any] = {"listener": None, "queue": None}
+
+# Bound once: get_request_id runs for every log event
+_get_correlation_id = correlation_id.get
+
 
 def get_request_id(
     _logger: Any, _method_name: str, event_dict: MutableMapping[str, Any]
 ) -> MutableMapping[str, Any]:
     """Add request_id from asgi-correlation-id contextvar to log events."""
-    request_id = correlation_id.get()
+    request_id = _get_correlation_id()
     if request_id:
         event_dict["request_id"] = request_id
     return event_dict
 
 
+# Shared processors for both stdlib and structlog (timestamper is added per format)
+_SHARED_PROCESSORS: tuple[Processor, ...] = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    get_request_id,  # Inject request_id from contextvar
+    structlog.processors.StackInfoRenderer(),
+)
+
+
+def _add_logger_name(
+    logger: Any, _method_name: str, event_dict: MutableMapping[str, Any]
+) -> MutableMapping[str, Any]:
+    """Add the logger name for non-stdlib (queue) loggers."""
+    name = getattr(logger, "name", None)
+    if name:
+        event_dict["logger"] = name
+    return event_dict
+
+
+def _json_serializer() -> Callable[..., str]:
+    """Pick the JSON serializer for the queue logger: orjson if installed, else stdlib json."""
+    if importlib.util.find_spec("orjson") is None:
+        return json.dumps
+
+    import orjson
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, **kwargs).decode()
+
+    return dumps
+
+
+class _QueueLogger:
+    """structlog logger that hands rendered JSON lines to the stdout writer queue.
+
+    Sharing the queue with stdlib records keeps structlog and stdlib output in
+    call order on a single writer, instead of structlog writing stdout directly.
+    The queue is looked up on every call, so loggers cached before a later
+    setup_logging() write to the current queue rather than an orphaned one.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str | None) -> None:
+        self.name = name
+
+    def msg(self, message: str) -> None:
+        _state["queue"].put(logging.makeLogRecord({"msg": message, "levelno": logging.NOTSET}))
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
+
+
+class _QueueDrainStreamHandler(logging.StreamHandler):
+    """Stdout handler that flushes only once the log queue is drained.
+
+    StreamHandler flushes after every record, costing one write() syscall per
+    line. Deferring the flush lets a burst of records share stdout's buffer
+    while an idle queue still flushes immediately.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue[logging.LogRecord]) -> None:
+        super().__init__(sys.stdout)
+        self._queue = log_queue
+
+    def flush(self) -> None:
+        if self._queue.empty():
+            super().flush()
+
+
 def setup_logging() -> None:
     """Configure structured logging for the entire application.
 
@@ -49,14 +131,16 @@ def setup_logging() -> None:
     """
     log_level = logging_config.log_level.upper()
 
-    # Shared processors for both stdlib and structlog
-    shared_processors: list[Processor] = [
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        get_request_id,  # Inject request_id from contextvar
-        structlog.processors.TimeStamper(fmt="iso", utc=True),
-        structlog.processors.StackInfoRenderer(),
-    ]
+    # JSON logs carry a float epoch (cheap to produce and encode); console keeps ISO
+    timestamper = structlog.processors.TimeStamper(
+        fmt=None if logging_config.log_format == "json" else "iso", utc=True
+    )
+    shared_processors = (*_SHARED_PROCESSORS, timestamper)
+
+    # Records are formatted on the logging thread (request_id lives in a
+    # contextvar there) and written to stdout by a background listener thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _state["queue"] = log_queue
 
     # Choose renderer based on environment
     renderer: Processor
@@ -75,27 +159,49 @@ def setup_logging() -> None:
             # Fallback if rich not installed
             renderer = structlog.dev.ConsoleRenderer(colors=False)
 
-    # Configure structlog
-    structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            *shared_processors,
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
-        context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+    if logging_config.log_format == "json":
+        # Production: structlog events render straight to JSON and are queued
+        # for the stdout writer, skipping stdlib dispatch; only foreign stdlib
+        # loggers use the formatter
+        structlog.configure(
+            processors=[
+                structlog.processors.add_log_level,
+                _add_logger_name,
+                get_request_id,
+                timestamper,
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(serializer=_json_serializer()),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.getLevelName(log_level)),
+            context_class=dict,
+            logger_factory=lambda name=None, *_args: _QueueLogger(name),
+            cache_logger_on_first_use=True,
+        )
+    else:
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                *shared_processors,
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ],
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
 
-    # Configure stdlib logging to use structlog formatting
+    # Configure stdlib logging (uvicorn, sqlalchemy, logging.getLogger users)
+    # to use structlog formatting
     formatter = structlog.stdlib.ProcessorFormatter(
         processor=renderer,
         foreign_pre_chain=shared_processors,
     )
 
-    # Console handler with structlog formatter
-    handler = logging.StreamHandler(sys.stdout)
+    handler = QueueHandler(log_queue)
     handler.setFormatter(formatter)
+    _start_listener(
+        QueueListener(log_queue, _QueueDrainStreamHandler(log_queue), respect_handler_level=True)
+    )
 
     # Root logger configuration
     root_logger = logging.getLogger()
@@ -103,19 +209,22 @@ def setup_logging() -> None:
     root_logger.addHandler(handler)
     root_logger.setLevel(log_level)
 
-    # Configure uvicorn loggers to use the same handler/formatter
-    for uvicorn_logger_name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
+    # Configure uvicorn loggers to use the same handler/formatter, in one pass
+    uvicorn_levels = {
+        "uvicorn": log_level,
+        "uvicorn.error": log_level,
+        "uvicorn.access": logging_config.log_level_uvicorn_access.upper(),
+    }
+    for uvicorn_logger_name, uvicorn_level in uvicorn_levels.items():
         uvicorn_logger = logging.getLogger(uvicorn_logger_name)
         uvicorn_logger.handlers.clear()
         uvicorn_logger.addHandler(handler)
         uvicorn_logger.propagate = False
+        uvicorn_logger.setLevel(uvicorn_level)
 
     # Set levels for noisy third-party libraries
     logging.getLogger("sqlalchemy.engine").setLevel(logging_config.log_level_sqlalchemy.upper())
     logging.getLogger("httpx").setLevel(logging_config.log_level_httpx.upper())
-    logging.getLogger("uvicorn").setLevel(log_level)
-    logging.getLogger("uvicorn.access").setLevel(logging_config.log_level_uvicorn_access.upper())
-    logging.getLogger("uvicorn.error").setLevel(log_level)
 
     # Log startup message
     logger = structlog.get_logger(__name__)
@@ -124,3 +233,37 @@ def setup_logging() -> None:
         log_format=logging_config.log_format,
         log_level=log_level,
     )
+
+
+def _start_listener(listener: QueueListener) -> None:
+    """Start the stdout writer thread, replacing any previous one."""
+    stop_logging()
+    listener.start()
+    _state["listener"] = listener
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the background writer thread."""
+    listener = _state["listener"]
+    if listener is not None:
+        _state["listener"] = None
+        listener.stop()
+
+
+def _restart_listener_after_fork() -> None:
+    """Start a fresh writer thread in a forked child (threads do not survive fork).
+
+    Workers forked from a preloaded app (gunicorn ``preload_app``) inherit the
+    QueueHandler and its queue but not the listener thread draining it.
+    """
+    listener = _state["listener"]
+    if listener is not None:
+        _state["listener"] = QueueListener(
+            listener.queue, *listener.handlers, respect_handler_level=listener.respect_handler_level
+        )
+        _state["listener"].start()
+
+
+# Runs after the server has finished logging its own shutdown messages
+atexit.register(stop_logging)
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
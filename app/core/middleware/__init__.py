@@ -0,0 +1,5 @@
+"""ASGI middleware for the FastAPI application."""
+
+from .correlation import CorrelationIdMiddleware
+
+__all__ = ["CorrelationIdMiddleware"]
@@ -0,0 +1,72 @@
+"""Request ID (correlation) middleware.
+
+Pure ASGI replacement for `asgi_correlation_id.CorrelationIdMiddleware` that
+reads and writes the raw header lists instead of wrapping them in
+`MutableHeaders` twice per request. The ID is stored in asgi-correlation-id's
+`correlation_id` contextvar, so `logging_config.get_request_id` is unchanged.
+"""
+
+import os
+from collections.abc import Callable
+
+from asgi_correlation_id import correlation_id
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = ["CorrelationIdMiddleware"]
+
+
+def _generate_request_id() -> str:
+    """Generate a 16-character hex request ID.
+
+    Same shape as `uuid4().hex[:16]` without building and formatting a UUID.
+    """
+    return os.urandom(8).hex()
+
+
+class CorrelationIdMiddleware:
+    """Load the request ID from a header (or generate one) and echo it back."""
+
+    __slots__ = ("_header_key", "app", "generator")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Request-ID",
+        generator: Callable[[], str] = _generate_request_id,
+    ) -> None:
+        self.app = app
+        self.generator = generator
+        # ASGI header names are lower-cased latin-1 bytes
+        self._header_key = header_name.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        header_key = self._header_key
+        request_id = ""
+        for key, value in scope["headers"]:
+            if key == header_key:
+                request_id = value.decode("latin-1")
+                break
+
+        if not request_id:
+            request_id = self.generator()
+            # Downstream readers of the request header see the generated ID
+            scope["headers"] = [
+                *(item for item in scope["headers"] if item[0] != header_key),
+                (header_key, request_id.encode("latin-1")),
+            ]
+
+        # Not reset on exit: ServerErrorMiddleware logs unhandled errors after this
+        # returns, and each request already runs in its own context copy
+        correlation_id.set(request_id)
+        response_header = (header_key, request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), response_header]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
@@ -14,7 +14,8 @@ Configuration:
 
 import importlib
 import logging
-from collections.abc import Mapping, Sequence
+import os
+from collections.abc import Iterator, Mapping, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -29,43 +30,49 @@ class RouterDiscoveryError(Exception):
 
 _CONFIG_PREFIX_KEY = "prefix"
 _CONFIG_TAGS_KEY = "tags"
+# Keys handled separately from the pass-through include_router kwargs
+_EXCLUDED_INCLUDE_KEYS = frozenset((_CONFIG_PREFIX_KEY, _CONFIG_TAGS_KEY))
 
 
-def _iter_route_files(routes_dir: Path) -> list[Path]:
-    return sorted(
-        (
-            py_file
-            for py_file in routes_dir.rglob("*.py")
-            if py_file.is_file() and not py_file.name.startswith("_")
-        ),
-        key=lambda path: path.as_posix(),
-    )
+def _scan_py_files(directory: str) -> Iterator[str]:
+    """Yield `.py` file paths under a directory, skipping `_`-prefixed files.
 
-
-def _infer_module_path(routes_dir: Path, py_file: Path) -> str:
-    """Infer the importable module path for a route file.
-
-    Default expectation: routes live under an importable package like `app/routes/*`.
-    For example, `app/routes/v1/events.py` -> `app.routes.v1.events`.
+    `os.scandir` reuses the file type from the directory read, so no extra
+    `stat()` is issued per entry (unlike `Path.rglob` + `is_file`).
     """
-    routes_package = routes_dir.name
-    if routes_package == "routes":
-        base_package = routes_dir.parent.name
-        rel_module = ".".join(py_file.relative_to(routes_dir).with_suffix("").parts)
-        return f"{base_package}.routes.{rel_module}"
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_py_files(entry.path)
+            elif entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file():
+                yield entry.path
 
-    # Fallback: build from project root (parent of 'app')
-    # e.g., <root>/app/routes/v1/events.py -> app.routes.v1.events
-    project_root = routes_dir.parent.parent
-    relative_path = py_file.relative_to(project_root)
-    return ".".join(relative_path.with_suffix("").parts)
 
+def _iter_route_modules(routes_dir: Path) -> list[tuple[Path, str, str]]:
+    """List route files as `(file, module_path, route_path)`, sorted by path.
 
-def _load_router_config(module: Any, py_file: Path, module_path: str) -> dict[str, Any]:
-    if not hasattr(module, "ROUTER_CONFIG"):
+    Routes live under an importable package like `app/routes/*`, so the package
+    prefix is resolved once: `app/routes/v1/events.py` -> `app.routes.v1.events`
+    with default route path `v1/events`.
+    """
+    package = f"{routes_dir.parent.name}.{routes_dir.name}"
+    root = str(routes_dir)
+    paths = sorted(_scan_py_files(root))
+
+    # scandir paths are `root + os.sep + relative`: slice off the root and ".py"
+    start = len(root) + len(os.sep)
+    modules: list[tuple[Path, str, str]] = []
+    for path in paths:
+        route_path = path[start:-3].replace(os.sep, "/")
+        modules.append((Path(path), f"{package}.{route_path.replace('/', '.')}", route_path))
+    return modules
+
+
+def _load_router_config(module: Any, py_file: Path, module_path: str) -> Mapping[str, Any]:
+    router_config = vars(module).get("ROUTER_CONFIG")
+    if router_config is None:
         return {}
 
-    router_config = module.ROUTER_CONFIG
     if not isinstance(router_config, Mapping):
         msg = (
             f"Router file '{py_file.name}' has ROUTER_CONFIG but it's not a mapping.\n"
@@ -75,7 +82,8 @@ def _load_router_config(module: Any, py_file: Path, module_path: str) -> dict[st
         )
         raise RouterDiscoveryError(msg)
 
-    return dict(router_config)
+    # Only read; discover_routers builds fresh include kwargs from it
+    return router_config
 
 
 def _normalize_tags(value: Any, py_file: Path, module_path: str) -> list[str]:
@@ -113,9 +121,7 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
     """
     routers: list[tuple[APIRouter, dict[str, Any]]] = []
 
-    for py_file in _iter_route_files(routes_dir):
-        module_path = _infer_module_path(routes_dir, py_file)
-
+    for py_file, module_path, route_path in _iter_route_modules(routes_dir):
         try:
             module = importlib.import_module(module_path)
         except Exception as e:
@@ -126,7 +132,9 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
             )
             raise RouterDiscoveryError(msg) from e
 
-        if not hasattr(module, "router"):
+        # One __dict__ lookup instead of hasattr + getattr (no AttributeError on a miss)
+        router = vars(module).get("router")
+        if router is None:
             msg = (
                 f"Router file '{py_file.name}' does not export a 'router' variable.\n"
                 f"  File: {py_file}\n"
@@ -134,8 +142,6 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
             )
             raise RouterDiscoveryError(msg)
 
-        router = module.router
-
         if not isinstance(router, APIRouter):
             msg = (
                 f"Router file '{py_file.name}' exports 'router' but it's not an APIRouter "
@@ -152,9 +158,7 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
         # Key idea: DO NOT pass prefix/tags if the router already defines them,
         # otherwise they will be applied twice.
         include_kwargs: dict[str, Any] = {
-            key: value
-            for key, value in router_config.items()
-            if key not in {_CONFIG_PREFIX_KEY, _CONFIG_TAGS_KEY}
+            key: value for key, value in router_config.items() if key not in _EXCLUDED_INCLUDE_KEYS
         }
 
         if not router.prefix:
@@ -170,8 +174,7 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
                     raise RouterDiscoveryError(msg)
                 include_kwargs[_CONFIG_PREFIX_KEY] = prefix_value
             else:
-                route_path = py_file.relative_to(routes_dir).with_suffix("")
-                include_kwargs[_CONFIG_PREFIX_KEY] = f"/api/{route_path.as_posix()}"
+                include_kwargs[_CONFIG_PREFIX_KEY] = f"/api/{route_path}"
 
         if not router.tags:
             if _CONFIG_TAGS_KEY in router_config:
@@ -179,7 +182,7 @@ def discover_routers(routes_dir: Path) -> list[tuple[APIRouter, dict[str, Any]]]
                     router_config[_CONFIG_TAGS_KEY], py_file, module_path
                 )
             else:
-                include_kwargs[_CONFIG_TAGS_KEY] = [py_file.stem]
+                include_kwargs[_CONFIG_TAGS_KEY] = [route_path.rpartition("/")[2]]
 
         routers.append((router, include_kwargs))
 
@@ -212,14 +215,10 @@ def register_routers(app: FastAPI, routes_dir: Path | None = None) -> None:
         logger.warning("No routers discovered (only files starting with _ found)")
         return
 
-    logger.info("Found %s router(s)", len(routers))
-
+    registered: list[str] = []
     for router, config in routers:
         try:
             app.include_router(router, **config)
-            effective_prefix = config.get("prefix") or router.prefix or ""
-            effective_tags = config.get("tags") or list(router.tags or [])
-            logger.info("  - %s (tags: %s)", effective_prefix, effective_tags)
         except Exception as e:
             msg = (
                 f"Failed to register router with prefix '{config.get('prefix', 'unknown')}'.\n"
@@ -227,3 +226,9 @@ def register_routers(app: FastAPI, routes_dir: Path | None = None) -> None:
                 f"  Error: {e}"
             )
             raise RouterDiscoveryError(msg) from e
+
+        effective_prefix = config.get("prefix") or router.prefix or ""
+        effective_tags = config.get("tags") or list(router.tags or [])
+        registered.append(f"{effective_prefix} (tags: {effective_tags})")
+
+    logger.info("Registered %s router(s): %s", len(registered), ", ".join(registered))
@@ -68,6 +68,17 @@ class SecretsLoader:
     Override `load_secret()` for custom implementations (Vault, AWS, etc.)
     """
 
+    __slots__ = (
+        "_env_prefix",
+        "_file_cache",
+        "_file_mtime",
+        "_resolved",
+        "base_path",
+        "env",
+        "mode",
+        "project_name",
+    )
+
     def __init__(
         self,
         mode: SecretsMode | str = SecretsMode.FILE,
@@ -86,6 +97,8 @@ class SecretsLoader:
         """
         self.mode = SecretsMode(mode) if isinstance(mode, str) else mode
         self.project_name = project_name
+        # Env-mode variable prefix: {PROJECT}_
+        self._env_prefix = f"{project_name.upper()}_"
         self.env = _normalize_env(env or os.getenv("ENV", "local"))
 
         # Default: app/env_files for local, /etc/{project_name} for production
@@ -96,6 +109,12 @@ class SecretsLoader:
         else:
             self.base_path = Path(f"/etc/{project_name}")
 
+        # Parsed secrets file, reloaded when its mtime changes
+        self._file_cache: dict[str, str] | None = None
+        self._file_mtime: int | None = None
+        # Secrets resolved in env/custom mode; configure_secrets() starts a fresh loader
+        self._resolved: dict[str, str] = {}
+
     @property
     def secrets_file(self) -> Path:
         """Path to secrets file: {base_path}/.secrets_{env}"""
@@ -115,9 +134,16 @@ class SecretsLoader:
         Raises:
             ValueError: If secret not found and no default provided
         """
+        value = self._resolved.get(name)
+        if value is not None:
+            return value
+
         value = self._load(name)
 
         if value is not None:
+            # File mode stays uncached here: it already re-reads only on mtime change
+            if self.mode != SecretsMode.FILE:
+                self._resolved[name] = value
             return value
 
         if default is not None:
@@ -136,27 +162,39 @@ class SecretsLoader:
 
     def _load_from_file(self, name: str) -> str | None:
         """Load secret from .{env}_secrets file (KEY=VALUE format)."""
-        if not self.secrets_file.exists():
-            return None
-
         try:
-            for line in self.secrets_file.read_text().splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    if key.strip() == name:
-                        return value.strip().strip("'\"")
-        except Exception:
+            mtime = self.secrets_file.stat().st_mtime_ns
+        except OSError:
             return None
 
-        return None
+        if self._file_cache is None or self._file_mtime != mtime:
+            try:
+                self._file_cache = self._parse_secrets_file()
+            except Exception:
+                return None
+            self._file_mtime = mtime
+
+        return self._file_cache.get(name)
+
+    def _parse_secrets_file(self) -> dict[str, str]:
+        """Parse the secrets file into a dict (first occurrence of a key wins)."""
+        secrets: dict[str, str] = {}
+        for line in self.secrets_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line:
+                key, value = line.split("=", 1)
+                value = value.strip()
+                # Drop one pair of matching surrounding quotes
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+                    value = value[1:-1]
+                secrets.setdefault(key.strip(), value)
+        return secrets
 
     def _load_from_env(self, name: str) -> str | None:
         """Load from environment variable: {PROJECT}_{SECRET_NAME}"""
-        env_var = f"{self.project_name.upper()}_{name}"
-        return os.getenv(env_var)
+        return os.getenv(self._env_prefix + name)
 
     def load_secret(self, name: str) -> str | None:
         """
@@ -183,7 +221,7 @@ class SecretsLoader:
                 f"  Add: {name}=your_value"
             )
         if self.mode == SecretsMode.ENV:
-            env_var = f"{self.project_name.upper()}_{name}"
+            env_var = self._env_prefix + name
             return (
                 f"Required secret '{name}' not found.\n"
                 f"  Mode: env\n"
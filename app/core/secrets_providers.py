@@ -25,6 +25,8 @@ class AWSSecretsLoader(SecretsLoader):
         configure_secrets(loader=loader)
     """
 
+    __slots__ = ("_cache", "_client", "region", "secret_name")
+
     def __init__(
         self,
         secret_name: str,
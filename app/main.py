@@ -16,14 +16,12 @@ Architecture:
     - All I/O operations use async/await for optimal concurrency
 """
 
-import uuid
-
-from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core import app_lifespan, register_routers, setup_logging
 from app.core.exceptions.handlers import register_exception_handlers
+from app.core.middleware import CorrelationIdMiddleware
 from app.main_config import cors_config, fastapi_config, settings
 
 # =============================================================================
@@ -43,6 +41,12 @@ app = FastAPI(
     root_path=fastapi_config.root_path,
 )
 
+# Middleware added last runs first: CORS must stay outermost so preflights are
+# answered before any request ID work.
+
+# Add correlation ID middleware (adds request_id to context)
+app.add_middleware(CorrelationIdMiddleware, header_name="X-Request-ID")
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -52,15 +56,6 @@ app.add_middleware(
     allow_headers=cors_config.headers_list,
 )
 
-# Add correlation ID middleware (adds request_id to context)
-app.add_middleware(
-    CorrelationIdMiddleware,
-    header_name="X-Request-ID",
-    generator=lambda: uuid.uuid4().hex[:16],
-    validator=None,
-    transformer=lambda x: x,
-)
-
 # Register exception handlers
 register_exception_handlers(app)
 
@@ -80,6 +75,8 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
-        workers=settings.workers,
+        workers=1 if settings.reload else settings.workers,  # reloader runs one worker
+        loop=settings.loop,
+        http=settings.http,
         log_config=None,  # Disable uvicorn's logging config to use our structlog setup
     )
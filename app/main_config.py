@@ -70,14 +70,15 @@ Development Override:
     LOCAL_ENV_OVERRIDE = Environment.PROD  # In main_config.py
 """
 
-from functools import lru_cache
-from typing import Any
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Literal, Self
 from urllib.parse import quote_plus
 
-from pydantic import Field, Secret, SecretStr, field_validator, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import AliasChoices, Field, Secret, SecretStr, field_validator, model_validator
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
 
-from app.core.config_loader import Environment, get_env_files
+from app.core.config_loader import CachedDotEnvSettingsSource, Environment, get_env_files
 from app.core.secrets import get_secret, secret_field
 
 # =============================================================================
@@ -89,6 +90,30 @@ LOCAL_ENV_OVERRIDE: Environment | None = None  # e.g., Environment.UATBIZ
 ENV_FILES = get_env_files(LOCAL_ENV_OVERRIDE)
 
 
+class _EnvFileSettings(BaseSettings):
+    """Base for config classes: ENV_FILES are parsed once and shared by all of them.
+
+    Subclasses must not set `env_file`: pydantic-settings always builds its own
+    dotenv source from it, which would re-read the files per class.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        return (
+            init_settings,
+            env_settings,
+            CachedDotEnvSettingsSource(settings_cls, env_file=ENV_FILES),
+            file_secret_settings,
+        )
+
+
 # =============================================================================
 # Config Classes
 # =============================================================================
@@ -99,8 +124,8 @@ ENV_FILES = get_env_files(LOCAL_ENV_OVERRIDE)
 # -----------------------------------------------------------------------------
 
 
-class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=ENV_FILES, extra="ignore")
+class Settings(_EnvFileSettings):
+    model_config = SettingsConfigDict(extra="ignore")
 
     env: Environment = Field(default=Environment.LOCAL)
     debug: bool = Field(default=False)
@@ -108,7 +133,12 @@ class Settings(BaseSettings):
     host: str = Field(default="127.0.0.1")
     port: int = Field(default=8000)
     reload: bool = Field(default=False)
-    workers: int = Field(default=1)
+    # WORKERS, or the conventional WEB_CONCURRENCY; each worker is a full process
+    workers: int = Field(default=1, validation_alias=AliasChoices("workers", "web_concurrency"))
+    # uvicorn picks uvloop (libuv event loop) when installed; "asyncio" forces the stdlib loop
+    loop: Literal["auto", "asyncio", "uvloop"] = Field(default="auto")
+    # uvicorn picks httptools (C HTTP parser) when installed; "h11" forces pure Python
+    http: Literal["auto", "h11", "httptools"] = Field(default="auto")
 
     # @model_validator(mode="before")
     # @classmethod
@@ -121,13 +151,14 @@ class Settings(BaseSettings):
     #         )
     #     return data
 
-    @field_validator("debug", "reload")
-    @classmethod
-    def _no_debug_in_prod(cls, v: bool, info) -> bool:
-        if info.data.get("env") == Environment.PROD and v:
-            msg: str = f"{info.field_name} cannot be True in production"
+    @model_validator(mode="after")
+    def _no_debug_in_prod(self) -> Self:
+        # One check per instance instead of a validator call per field
+        if self.env == Environment.PROD and (self.debug or self.reload):
+            field_name = "debug" if self.debug else "reload"
+            msg: str = f"{field_name} cannot be True in production"
             raise ValueError(msg)
-        return v
+        return self
 
     @property
     def is_production(self) -> bool:
@@ -146,10 +177,10 @@ class Settings(BaseSettings):
         return self.env in (Environment.UAT, Environment.UATBIZ, Environment.SANITY)
 
 
-class FastAPIConfig(BaseSettings):
+class FastAPIConfig(_EnvFileSettings):
     """FastAPI application configuration."""
 
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="FASTAPI_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="FASTAPI_", extra="ignore")
 
     title: str = "Eventually API"
     description: str = "Event management API"
@@ -167,7 +198,7 @@ class FastAPIConfig(BaseSettings):
         return v if v else None
 
 
-class DatabaseCredentials(BaseSettings):
+class DatabaseCredentials(_EnvFileSettings):
     """
     Database credentials - sensitive values loaded from SecretsLoader.
 
@@ -179,7 +210,7 @@ class DatabaseCredentials(BaseSettings):
         - Production: /etc/eventually/.secrets_{env}
     """
 
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="DATABASE_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", extra="ignore")
 
     host: Secret[str] = secret_field("DATABASE_HOST", default="localhost")
     db_name: Secret[str] = secret_field("DATABASE_NAME", default="eventually")
@@ -189,7 +220,7 @@ class DatabaseCredentials(BaseSettings):
     password: Secret[str] | None = secret_field("DATABASE_PASSWORD")
 
 
-class DatabaseConfig(BaseSettings):
+class DatabaseConfig(_EnvFileSettings):
     """
     Database connection pool configuration.
 
@@ -197,15 +228,37 @@ class DatabaseConfig(BaseSettings):
     Credentials loaded separately via DatabaseCredentials.
     """
 
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="DATABASE_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="DATABASE_", extra="ignore")
 
     driver: str = "postgresql+asyncpg"
-    pool_size: int = 5
-    max_overflow: int = 10
+    pool_size: int = 20
+    max_overflow: int = 30
+    # Concurrent requests one worker should serve; pool_size + max_overflow must cover it
+    expected_concurrency: int = 50
+    # Server-side connection limit (PostgreSQL max_connections) shared by all workers
+    max_server_connections: int = 100
     pool_timeout: int = 15
     pool_recycle: int = 900
+    # Validate connections on checkout so a database restart doesn't fail the first
+    # request on each stale connection (request sessions have no retry). Disable only
+    # where every unit of work is a read wrapped in retry_read_on_disconnect.
     pool_pre_ping: bool = True
+    pool_warmup: bool = True  # Open pool_size connections at startup
+    pool_warmup_timeout: float = 5.0  # Seconds per warm-up phase before connecting lazily
+    pool_use_lifo: bool = True  # Reuse the most recently returned (warm) connection first
     echo: bool = False
+    query_cache_size: int = 1200  # SQLAlchemy compiled-SQL LRU entries per engine
+    statement_cache_size: int = 500  # asyncpg prepared statements per connection
+
+    @property
+    def connect_args(self) -> dict[str, int]:
+        """Driver-level connect arguments (asyncpg prepared-statement caches)."""
+        if "asyncpg" not in self.driver:
+            return {}
+        return {
+            "prepared_statement_cache_size": self.statement_cache_size,
+            "statement_cache_size": self.statement_cache_size,
+        }
 
     # Cached credentials instance
     _credentials: DatabaseCredentials | None = None
@@ -224,9 +277,9 @@ class DatabaseConfig(BaseSettings):
             self._credentials = DatabaseCredentials()
         return self._credentials
 
-    @property
+    @cached_property
     def url(self) -> str:
-        """Build database URL from credentials."""
+        """Build database URL from credentials (once per config instance)."""
         creds = self.credentials
         password = creds.password.get_secret_value() if creds.password else ""
         return f"{self.driver}://{creds.user.get_secret_value()}:{quote_plus(password)}@{creds.host.get_secret_value()}:{creds.port.get_secret_value()}/{creds.db_name.get_secret_value()}"
@@ -237,19 +290,20 @@ class DatabaseConfig(BaseSettings):
 # -----------------------------------------------------------------------------
 
 
-class CORSConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="CORS_", extra="ignore")
+class CORSConfig(_EnvFileSettings):
+    model_config = SettingsConfigDict(env_prefix="CORS_", extra="ignore")
 
     allow_origins: str = "http://localhost:5173,http://localhost:3000"
     allow_credentials: bool = True
     allow_methods: str = "*"
     allow_headers: str = "*"
 
-    @property
+    # Parsed once per instance; settings are not mutated after load
+    @cached_property
     def origins_list(self) -> list[str]:
         return [o.strip() for o in self.allow_origins.split(",")]
 
-    @property
+    @cached_property
     def methods_list(self) -> list[str]:
         return (
             ["*"]
@@ -257,7 +311,7 @@ class CORSConfig(BaseSettings):
             else [m.strip() for m in self.allow_methods.split(",")]
         )
 
-    @property
+    @cached_property
     def headers_list(self) -> list[str]:
         return (
             ["*"]
@@ -266,7 +320,7 @@ class CORSConfig(BaseSettings):
         )
 
 
-class LoggingConfig(BaseSettings):
+class LoggingConfig(_EnvFileSettings):
     """Structured logging configuration with console/JSON output.
 
     Supports:
@@ -274,7 +328,7 @@ class LoggingConfig(BaseSettings):
     - json: Machine-parseable logs for production
     """
 
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="LOG_", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="LOG_", extra="ignore")
 
     log_level: str = "INFO"
     log_format: str = "console"  # "console" or "json"
@@ -290,8 +344,8 @@ class LoggingConfig(BaseSettings):
 # -----------------------------------------------------------------------------
 
 
-class RedisConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="REDIS_", extra="ignore")
+class RedisConfig(_EnvFileSettings):
+    model_config = SettingsConfigDict(env_prefix="REDIS_", extra="ignore")
 
     host: str = "localhost"
     port: int = 6379
@@ -313,8 +367,8 @@ class RedisConfig(BaseSettings):
         return f"redis://{self.host}:{self.port}/{self.db}"
 
 
-class JWTConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="JWT_", extra="ignore")
+class JWTConfig(_EnvFileSettings):
+    model_config = SettingsConfigDict(env_prefix="JWT_", extra="ignore")
 
     secret_key: SecretStr | None = Field(default=None)
     algorithm: str = "HS256"
@@ -329,8 +383,8 @@ class JWTConfig(BaseSettings):
         return data
 
 
-class APIConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file=ENV_FILES, env_prefix="API_", extra="ignore")
+class APIConfig(_EnvFileSettings):
+    model_config = SettingsConfigDict(env_prefix="API_", extra="ignore")
 
     key: SecretStr | None = Field(default=None)
     secret: SecretStr | None = Field(default=None)
@@ -408,7 +462,23 @@ database_config = get_database_config()
 cors_config = get_cors_config()
 logging_config = get_logging_config()
 
-# Optional instances (uncomment as needed)
-# redis_config = get_redis_config()
-jwt_config = get_jwt_config()
-# api_config = get_api_config()
+# Optional instances: built on first access (PEP 562), so unused configs cost nothing
+_LAZY_INSTANCES: dict[str, Callable[[], BaseSettings]] = {
+    "redis_config": get_redis_config,
+    "jwt_config": get_jwt_config,
+    "api_config": get_api_config,
+}
+
+if TYPE_CHECKING:
+    redis_config: RedisConfig
+    jwt_config: JWTConfig
+    api_config: APIConfig
+
+
+def __getattr__(name: str) -> Any:
+    loader = _LAZY_INSTANCES.get(name)
+    if loader is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    instance = globals()[name] = loader()
+    return instance
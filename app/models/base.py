@@ -6,7 +6,7 @@ Database connection logic lives in app.core.database.
 
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -16,7 +16,12 @@ def utc_now() -> datetime:
 
 
 class Base(DeclarativeBase):
-    """Base class for all SQLAlchemy ORM models."""
+    """Base class for all SQLAlchemy ORM models.
+
+    Repositories can set ``_RAISE_ON_LAZY_LOAD = True`` so relationships left at
+    lazy="select" raise instead of lazy loading; load them with
+    selectinload/joinedload options (or a mapper-level eager strategy).
+    """
 
 
 class TimestampMixin:
@@ -28,11 +33,18 @@ class TimestampMixin:
             id: Mapped[int] = mapped_column(primary_key=True)
     """
 
+    # Python default fills the value on every insert path (ORM, Core, COPY), so
+    # tables created before server_default existed still work; server_default
+    # covers raw SQL inserts on tables created with it.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, nullable=False
+        DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+        DateTime(timezone=True),
+        default=utc_now,
+        server_default=func.now(),
+        onupdate=utc_now,
+        nullable=False,
     )
 
 
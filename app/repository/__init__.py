@@ -6,6 +6,8 @@ Create repository classes extending BaseRepository:
     from app.models.user import User
 
     class UserRepository(BaseRepository[User, int]):
+        __slots__ = ()  # keep instances slotted (see BaseRepository)
+
         async def find_by_email(self, email: str) -> User | None:
             result = await self.session.execute(
                 select(User).where(User.email == email)
@@ -7,7 +7,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.core.database import AsyncDBPool
+from app.core.database import AsyncDBPool, retry_read_on_disconnect
 from app.main_config import fastapi_config
 
 logger = logging.getLogger(__name__)
@@ -34,6 +34,13 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy"}
 
 
+@retry_read_on_disconnect
+async def _ping_database() -> None:
+    """Run a trivial query on a pooled connection."""
+    async with AsyncDBPool.get_session() as session:
+        await session.execute(text("SELECT 1"))
+
+
 @router.get("/health/ready")
 async def readiness_check() -> JSONResponse:
     """Readiness probe — confirms the app can serve traffic.
@@ -45,8 +52,7 @@ async def readiness_check() -> JSONResponse:
 
     # Database check
     try:
-        async with AsyncDBPool.get_session() as session:
-            await session.execute(text("SELECT 1"))
+        await _ping_database()
         checks["database"] = "ok"
     except (RuntimeError, SQLAlchemyError) as exc:
         logger.warning("Readiness: database check failed: %s", exc)
@@ -0,0 +1,605 @@
+"""Test cases for BaseRepository CRUD operations (in-memory SQLite)."""
+
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import (
+    AsyncResult,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, mapped_column, raiseload, relationship
+
+from app.core.base_repository import _STATEMENT_CACHE, BaseRepository, _copy_records
+from app.models.base import Base, SoftDeleteMixin, TimestampMixin
+
+pytest.importorskip("aiosqlite")
+
+
+class Item(Base, TimestampMixin, SoftDeleteMixin):
+    """Test model."""
+
+    __tablename__ = "test_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    category: Mapped[str] = mapped_column(String(50), default="general")
+
+
+class ItemRepository(BaseRepository[Item, int]):
+    """Test repository."""
+
+    __slots__ = ()
+
+
+class Tag(Base):
+    """Test model only used to check class-creation statement prebuilding."""
+
+    __tablename__ = "test_tags"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class TagRepository(BaseRepository[Tag, int]):
+    """Test repository never instantiated."""
+
+    __slots__ = ()
+
+
+class Owner(Base):
+    """Test model with one lazy and one eagerly loaded relationship."""
+
+    __tablename__ = "test_owners"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    pets: Mapped[list["Pet"]] = relationship(back_populates="owner")
+    toys: Mapped[list["Pet"]] = relationship(lazy="selectin", viewonly=True)
+
+
+class Pet(Base):
+    """Test model referencing Owner."""
+
+    __tablename__ = "test_pets"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    owner_id: Mapped[int] = mapped_column(ForeignKey("test_owners.id"))
+    owner: Mapped[Owner] = relationship(back_populates="pets")
+
+
+class StrictOwnerRepository(BaseRepository[Owner, int]):
+    """Test repository raising on lazy loads."""
+
+    __slots__ = ()
+
+    _RAISE_ON_LAZY_LOAD = True
+
+
+class Country(Base):
+    """Test model with a non-"id" primary key."""
+
+    __tablename__ = "test_countries"
+
+    code: Mapped[str] = mapped_column(String(2), primary_key=True)
+
+
+class CountryRepository(BaseRepository[Country, str]):
+    """Test repository for a model keyed by code."""
+
+    __slots__ = ()
+
+
+class Membership(Base):
+    """Test model with a composite primary key."""
+
+    __tablename__ = "test_memberships"
+
+    owner_id: Mapped[int] = mapped_column(primary_key=True)
+    group_id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class MembershipRepository(BaseRepository[Membership, tuple[int, int]]):
+    """Test repository whose exists-by-ID statement cannot be prebuilt."""
+
+    __slots__ = ()
+
+
+class Token(Base):
+    """Test model with a per-row callable default."""
+
+    __tablename__ = "test_tokens"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50))
+    kind: Mapped[str] = mapped_column(String(10), default="api")
+    value: Mapped[str] = mapped_column(String(36), default=lambda: str(uuid4()), unique=True)
+
+
+class Animal(Base):
+    """Test single-table inheritance base."""
+
+    __tablename__ = "test_animals"
+    __mapper_args__ = {"polymorphic_on": "kind", "polymorphic_identity": "animal"}
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(10))
+    name: Mapped[str] = mapped_column(String(50))
+
+    @hybrid_property
+    def label(self) -> str:
+        """Kind-prefixed name."""
+        return self.kind + ":" + self.name
+
+
+class Dog(Animal):
+    """Test single-table inheritance subclass."""
+
+    __mapper_args__ = {"polymorphic_identity": "dog"}
+
+
+class Manager(Animal):
+    """Test joined-table inheritance subclass."""
+
+    __tablename__ = "test_managers"
+    __mapper_args__ = {"polymorphic_identity": "manager"}
+
+    id: Mapped[int] = mapped_column(ForeignKey("test_animals.id"), primary_key=True)
+    team: Mapped[str] = mapped_column(String(50))
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    """Create an isolated in-memory database session."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as db_session:
+        yield db_session
+
+    await engine.dispose()
+
+
+@pytest.fixture
+def no_returning(session: AsyncSession, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the dialect report no RETURNING support, like MySQL/MariaDB."""
+    dialect = session.get_bind().dialect
+    for flag in ("insert_returning", "insert_executemany_returning", "update_returning"):
+        monkeypatch.setattr(dialect, flag, False)
+
+
+@pytest.fixture
+def repo(session: AsyncSession) -> ItemRepository:
+    """Create repository bound to the test session."""
+    return ItemRepository(Item, session)
+
+
+# =============================================================================
+# Test Create
+# =============================================================================
+
+
+async def test_create(repo: ItemRepository) -> None:
+    """Test single record creation populates PK and defaults."""
+    item = await repo.create(name="first")
+
+    assert item.id is not None
+    assert item.category == "general"
+    assert item.created_at is not None
+
+
+async def test_create_many(repo: ItemRepository) -> None:
+    """Test bulk creation returns instances in input order."""
+    items = await repo.create_many([{"name": f"item-{i}"} for i in range(5)])
+
+    assert [item.name for item in items] == [f"item-{i}" for i in range(5)]
+    assert all(item.id is not None for item in items)
+    assert all(item.created_at is not None for item in items)
+    assert await repo.count() == 5
+
+
+@pytest.mark.usefixtures("no_returning")
+async def test_create_many_without_returning(repo: ItemRepository) -> None:
+    """Test bulk creation falls back to add_all + flush without INSERT ... RETURNING."""
+    items = await repo.create_many([{"name": f"item-{i}"} for i in range(3)])
+
+    assert [item.name for item in items] == ["item-0", "item-1", "item-2"]
+    assert all(item.id is not None for item in items)
+
+
+async def test_create_many_bulk(repo: ItemRepository) -> None:
+    """Test bulk insert returns primary keys in input order."""
+    ids = await repo.create_many_bulk([{"name": f"bulk-{i}"} for i in range(3)])
+
+    assert len(ids) == 3
+    assert [(await repo.get_by_id(id_)).name for id_ in ids] == ["bulk-0", "bulk-1", "bulk-2"]
+
+
+async def test_create_row(repo: ItemRepository) -> None:
+    """Test Core insert returns a row mapping with generated PK and defaults."""
+    row = await repo.create_row(name="core")
+
+    assert row["id"] is not None
+    assert row["category"] == "general"
+    assert (await repo.get_by_id(row["id"])).name == "core"
+
+
+@pytest.mark.usefixtures("no_returning")
+async def test_create_row_without_returning(repo: ItemRepository) -> None:
+    """Test Core insert reads the row back when RETURNING is unsupported."""
+    row = await repo.create_row(name="core")
+
+    assert row["name"] == "core"
+    assert row["category"] == "general"
+
+
+async def test_copy_many_falls_back_to_insert(repo: ItemRepository) -> None:
+    """Test bulk load without asyncpg inserts every row via executemany."""
+    count = await repo.copy_many({"name": f"copy-{i}", "category": "c"} for i in range(3))
+
+    assert count == 3
+    assert await repo.count(category="c") == 3
+    assert await repo.copy_many([]) == 0
+
+
+async def test_copy_many_rejects_mismatched_keys(repo: ItemRepository) -> None:
+    """Test rows with differing keys are rejected instead of losing values."""
+    with pytest.raises(ValueError, match="same keys"):
+        await repo.copy_many([{"name": "a"}, {"name": "b", "category": "x"}])
+
+    assert await repo.count() == 0
+
+
+def test_copy_records_fills_defaults_per_row() -> None:
+    """Test COPY records get scalar defaults and a fresh callable default per row."""
+    columns, records = _copy_records(Token.__table__, [{"name": "a"}, {"name": "b"}])
+
+    assert columns == ["name", "kind", "value"]
+    assert [record[:2] for record in records] == [("a", "api"), ("b", "api")]
+    assert records[0][2] != records[1][2]
+
+
+@pytest.mark.usefixtures("no_returning")
+async def test_create_many_bulk_without_returning(repo: ItemRepository) -> None:
+    """Test bulk insert still returns primary keys in input order without RETURNING."""
+    ids = await repo.create_many_bulk([{"name": f"bulk-{i}"} for i in range(3)])
+
+    assert [(await repo.get_by_id(id_)).name for id_ in ids] == ["bulk-0", "bulk-1", "bulk-2"]
+
+
+async def test_create_many_streams_chunks(
+    repo: ItemRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test bulk creation consumes a generator across several insert batches."""
+    monkeypatch.setattr(ItemRepository, "_INSERT_CHUNK_SIZE", 2)
+    items = await repo.create_many({"name": f"gen-{i}"} for i in range(5))
+
+    assert [item.name for item in items] == [f"gen-{i}" for i in range(5)]
+    assert await repo.count() == 5
+
+
+async def test_create_many_empty(repo: ItemRepository) -> None:
+    """Test bulk creation with no items is a no-op."""
+    assert list(await repo.create_many([])) == []
+
+
+# =============================================================================
+# Test Read Operations
+# =============================================================================
+
+
+@pytest.fixture
+async def seeded(repo: ItemRepository) -> list[Item]:
+    """Seed repository with a few records."""
+    return list(
+        await repo.create_many(
+            [
+                {"name": "alpha", "category": "a"},
+                {"name": "beta", "category": "b"},
+                {"name": "gamma", "category": "a"},
+            ]
+        )
+    )
+
+
+async def test_get_by_id(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test lookup by primary key."""
+    item = await repo.get_by_id(seeded[1].id)
+
+    assert item is not None
+    assert item.name == "beta"
+    assert await repo.get_by_id(999) is None
+
+
+async def test_get_by_id_uses_identity_map(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test already-loaded instances are returned without a new query."""
+    assert await repo.get_by_id(seeded[0].id) is seeded[0]
+
+
+async def test_get_by(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test single record lookup by multiple filters."""
+    item = await repo.get_by(category="a", name="gamma")
+
+    assert item is not None
+    assert item.id == seeded[2].id
+    assert await repo.get_by(category="a", name="beta") is None
+
+
+async def test_get_by_multiple_matches(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test get_by returns a single match instead of raising on several."""
+    item = await repo.get_by(category="a")
+
+    assert item is not None
+    assert item.category == "a"
+
+
+async def test_filter_reuses_shape_with_new_values(
+    repo: ItemRepository, seeded: list[Item]
+) -> None:
+    """Test repeated filter shapes bind fresh values each call."""
+    first = await repo.filter(category="a", order_by="name")
+    second = await repo.filter(category="b", order_by="name")
+
+    assert [item.name for item in first] == ["alpha", "gamma"]
+    assert [item.name for item in second] == ["beta"]
+
+
+async def test_relationship_filters(session: AsyncSession) -> None:
+    """Test filter/get_by/count compare relationship attributes against the instance."""
+    first, second = Owner(), Owner()
+    session.add_all([first, second, Pet(owner=first), Pet(owner=second), Pet(owner=second)])
+    await session.flush()
+    pets = BaseRepository[Pet, int](Pet, session)
+
+    assert [pet.owner_id for pet in await pets.filter(owner=second)] == [second.id, second.id]
+    assert (await pets.get_by(owner=first)).owner_id == first.id  # type: ignore[union-attr]
+    assert await pets.count(owner=second) == 2
+    assert await pets.count(owner=first) == 1
+
+
+async def test_filter_none_matches_null(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test None filter values match NULL columns."""
+    items = await repo.filter(deleted_at=None)
+
+    assert len(items) == 3
+
+
+async def test_get_all_pagination(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test ordering, limit and offset."""
+    items = await repo.get_all(limit=2, offset=1, order_by="name", order_desc=True)
+
+    assert [item.name for item in items] == ["beta", "alpha"]
+
+
+async def test_get_all_rows(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test Core row reads return mappings rather than ORM instances."""
+    rows = await repo.get_all_rows(order_by="name", order_desc=True, category="a")
+
+    assert [row["name"] for row in rows] == ["gamma", "alpha"]
+    assert not isinstance(rows[0], Item)
+
+
+async def test_get_all_rows_column_subset(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test row reads can project only the requested columns."""
+    rows = await repo.get_all_rows(order_by="name", columns=("id", "name"), category="a")
+
+    assert [dict(row) for row in rows] == [
+        {"id": seeded[0].id, "name": "alpha"},
+        {"id": seeded[2].id, "name": "gamma"},
+    ]
+
+
+async def test_stream_rows(
+    repo: ItemRepository, seeded: list[Item], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test streamed rows match the buffered read across several fetch batches."""
+    monkeypatch.setattr(ItemRepository, "_STREAM_YIELD_PER", 1)
+    rows = [row async for row in repo.stream_rows(order_by="name")]
+
+    assert [row["name"] for row in rows] == ["alpha", "beta", "gamma"]
+
+
+async def test_stream_rows_closes_result_on_early_exit(
+    repo: ItemRepository, seeded: list[Item], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test closing the stream early closes the streamed result (server-side cursor)."""
+    closed: list[AsyncResult[Any]] = []
+    close = AsyncResult.close
+
+    async def track_close(result: AsyncResult[Any]) -> None:
+        closed.append(result)
+        await close(result)
+
+    monkeypatch.setattr(AsyncResult, "close", track_close)
+    monkeypatch.setattr(ItemRepository, "_STREAM_YIELD_PER", 1)
+    stream = repo.stream_rows(order_by="name")
+    assert (await anext(stream))["name"] == "alpha"
+    await stream.aclose()
+
+    assert len(closed) == 1
+    assert await repo.count() == 3
+
+
+async def test_row_reads_respect_inheritance(session: AsyncSession) -> None:
+    """Test count/row reads keep the discriminator, the joined table and hybrid filters."""
+    session.add_all(
+        [
+            Animal(name="cat"),
+            Dog(name="rex"),
+            Dog(name="fido"),
+            Manager(name="ann", team="core"),
+        ]
+    )
+    await session.flush()
+    dogs = BaseRepository[Dog, int](Dog, session)
+    managers = BaseRepository[Manager, int](Manager, session)
+    animals = BaseRepository[Animal, int](Animal, session)
+
+    assert await dogs.count() == 2
+    assert [row["name"] async for row in dogs.stream_rows(order_by="name")] == ["fido", "rex"]
+    assert [dict(row) for row in await managers.get_all_rows(columns=("name", "team"))] == [
+        {"name": "ann", "team": "core"}
+    ]
+    assert await managers.count(team="core") == 1
+    assert await animals.count(label="dog:rex") == 1
+
+
+async def test_get_page_after(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test keyset pagination walks pages by (order_by, id) cursor in both directions."""
+    first = await repo.get_page_after(size=2, order_by="name")
+    last = first[-1]
+    second = await repo.get_page_after(after=(last.name, last.id), size=2, order_by="name")
+
+    assert [item.name for item in first] == ["alpha", "beta"]
+    assert [item.name for item in second] == ["gamma"]
+
+    newest = await repo.get_page_after(size=1, order_desc=True)
+    older = await repo.get_page_after(after=(newest[0].id, newest[0].id), order_desc=True)
+    assert [item.name for item in older] == ["beta", "alpha"]
+
+
+async def test_count_and_exists(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test counting with filters and existence checks."""
+    assert await repo.count() == 3
+    assert await repo.count(category="a") == 2
+    assert await repo.exists(seeded[0].id) is True
+    assert await repo.exists(999) is False
+
+
+async def test_get_page(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test page retrieval with total count."""
+    items, total = await repo.get_page(page=2, size=1, order_by="name", category="a")
+
+    assert total == 2
+    assert [item.name for item in items] == ["gamma"]
+
+
+# =============================================================================
+# Test Update Operations
+# =============================================================================
+
+
+async def test_update_returns_refreshed_instance(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test update returns the updated row and syncs the identity map."""
+    original = seeded[0]
+    updated = await repo.update(original.id, name="alpha-2")
+
+    assert updated is original
+    assert updated.name == "alpha-2"
+    assert updated.category == "a"
+
+
+@pytest.mark.usefixtures("no_returning")
+async def test_update_without_returning(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test update re-reads the instance when UPDATE ... RETURNING is unsupported."""
+    updated = await repo.update(seeded[0].id, name="alpha-2")
+
+    assert updated is seeded[0]
+    assert updated.name == "alpha-2"
+    assert await repo.update(999, name="ghost") is None
+
+
+async def test_update_without_refresh(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test update with refresh=False skips returning the instance."""
+    assert await repo.update(seeded[0].id, refresh=False, name="renamed") is None
+    assert (await repo.get_by(name="renamed")) is not None
+
+
+async def test_update_missing_record(repo: ItemRepository) -> None:
+    """Test updating an unknown ID returns None."""
+    assert await repo.update(999, name="ghost") is None
+
+
+def test_repository_has_no_instance_dict(session: AsyncSession) -> None:
+    """Test repositories declaring __slots__ = () stay slotted."""
+    assert not hasattr(BaseRepository[Item, int](Item, session), "__dict__")
+    assert not hasattr(ItemRepository(Item, session), "__dict__")
+
+
+async def test_update_many_and_delete_many_chunked(
+    repo: ItemRepository, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test bulk update/delete across multiple IN (...) chunks."""
+    monkeypatch.setattr(ItemRepository, "_BULK_CHUNK_SIZE", 2)
+    items = await repo.create_many([{"name": f"item-{i}"} for i in range(5)])
+    ids = [item.id for item in items]
+
+    assert await repo.update_many(ids, category="bulk") == 5
+    assert await repo.count(category="bulk") == 5
+    assert await repo.delete_many(ids[:3]) == 3
+    assert await repo.count() == 2
+    assert await repo.delete_many([ids[3], 999]) == 1
+
+
+async def test_create_without_flush(repo: ItemRepository, session: AsyncSession) -> None:
+    """Test deferred flush leaves the instance pending until the session flushes."""
+    item = await repo.create(flush=False, name="pending")
+
+    assert item.id is None
+    assert item in session.new
+
+    await session.flush()
+    assert item.id is not None
+
+
+async def test_soft_delete(repo: ItemRepository, seeded: list[Item]) -> None:
+    """Test soft delete marks deleted_at instead of removing the row."""
+    assert await repo.soft_delete(seeded[0].id) is True
+    assert await repo.count(deleted_at=None) == 2
+    assert await repo.count() == 3
+
+
+async def test_load_options_applied_to_orm_reads(session: AsyncSession, seeded: list[Item]) -> None:
+    """Test repository loader options (e.g. debug raiseload) reach ORM SELECTs."""
+
+    class StrictItemRepository(BaseRepository[Item, int]):
+        __slots__ = ()
+        _LOAD_OPTIONS = (raiseload("*"),)
+
+    repo = StrictItemRepository(Item, session)
+    stmt, _ = repo._select("select", {})
+
+    assert stmt._with_options == StrictItemRepository._LOAD_OPTIONS
+    assert [item.name for item in await repo.get_all(order_by="name")] == [
+        "alpha",
+        "beta",
+        "gamma",
+    ]
+
+
+async def test_raise_on_lazy_load_keeps_eager_relationships(session: AsyncSession) -> None:
+    """Test opt-in lazy-load raising covers lazy="select" only, not mapper eager loads."""
+    session.add(Owner(id=1, pets=[Pet(id=1)]))
+    await session.commit()
+    session.expunge_all()
+
+    owner = await StrictOwnerRepository(Owner, session).get_by(id=1)
+
+    assert [pet.id for pet in owner.toys] == [1]
+    with pytest.raises(InvalidRequestError):
+        _ = owner.pets
+    assert ItemRepository(Item, session)._load_options() == ()
+
+
+def test_subclass_prebuilds_fixed_statements() -> None:
+    """Test binding a concrete model prebuilds its Core statements."""
+    assert (Tag, "exists") in _STATEMENT_CACHE
+    assert (Tag, "count", (), False, False, None, False, (), ()) in _STATEMENT_CACHE
+    assert (Country, "exists") in _STATEMENT_CACHE
+    assert (Membership, "exists") not in _STATEMENT_CACHE
+
+
+async def test_exists_uses_mapped_primary_key(session: AsyncSession) -> None:
+    """Test exists() resolves a primary key not named id."""
+    session.add(Country(code="fr"))
+    await session.flush()
+    countries = CountryRepository(Country, session)
+
+    assert await countries.exists("fr") is True
+    assert await countries.exists("de") is False
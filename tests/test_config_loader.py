@@ -0,0 +1,123 @@
+"""Test cases for environment detection and .env file selection."""
+
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+import pytest
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+from app.core import config_loader
+from app.core.config_loader import Environment
+
+
+@pytest.fixture(autouse=True)
+def reset_cache() -> Iterator[None]:
+    """Clear memoized lookups around each test."""
+    config_loader.clear_cache()
+    yield
+    config_loader.clear_cache()
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected"),
+    [
+        ("prod", Environment.PROD),
+        (" UAT ", Environment.UAT),
+        ("unknown", Environment.LOCAL),
+        ("", Environment.LOCAL),
+    ],
+)
+def test_get_current_environment(
+    monkeypatch: pytest.MonkeyPatch, env_value: str, expected: Environment
+) -> None:
+    """Test ENV normalization and fallback to LOCAL."""
+    monkeypatch.setenv("ENV", env_value)
+
+    assert config_loader.get_current_environment() is expected
+
+
+def test_get_current_environment_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test missing ENV defaults to LOCAL."""
+    monkeypatch.delenv("ENV", raising=False)
+
+    assert config_loader.get_current_environment() is Environment.LOCAL
+
+
+def test_get_env_files_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test base file is loaded before the environment-specific file."""
+    monkeypatch.setenv("ENV", "dev")
+
+    base_file, env_file = config_loader.get_env_files()
+
+    assert base_file.endswith(".env_base")
+    assert env_file.endswith(".env_dev")
+
+
+def test_unknown_env_uses_local_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test unrecognized ENV values resolve to the local .env file."""
+    monkeypatch.setenv("ENV", "staging")
+
+    assert config_loader.get_env_file().endswith(".env_local")
+
+
+def test_override_only_applies_locally(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test override is honored in local and ignored elsewhere."""
+    monkeypatch.setenv("ENV", "local")
+    assert config_loader.get_env_file(Environment.PROD).endswith(".env_prod")
+
+    config_loader.clear_cache()
+    monkeypatch.setenv("ENV", "uat")
+    assert config_loader.get_env_file(Environment.PROD).endswith(".env_uat")
+
+
+def test_clear_cache_rereads_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test cached environment is refreshed after clear_cache()."""
+    monkeypatch.setenv("ENV", "dev")
+    assert config_loader.get_current_environment() is Environment.DEV
+
+    monkeypatch.setenv("ENV", "prod")
+    assert config_loader.get_current_environment() is Environment.DEV
+
+    config_loader.clear_cache()
+    assert config_loader.get_current_environment() is Environment.PROD
+
+
+def test_cached_dotenv_source_parses_files_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test settings classes sharing env files parse them once, each with its own prefix."""
+    env_file = tmp_path / ".env_test"
+    env_file.write_text("A_VALUE=1\nB_VALUE=2\n")
+    env_files = (str(env_file),)
+    reads: list[Path] = []
+    read_env_file = DotEnvSettingsSource._read_env_file
+
+    def counting_read(self: DotEnvSettingsSource, file_path: Path) -> Mapping[str, str | None]:
+        reads.append(file_path)
+        return read_env_file(self, file_path)
+
+    monkeypatch.setattr(DotEnvSettingsSource, "_read_env_file", counting_read)
+
+    class _Base(BaseSettings):
+        @classmethod
+        def settings_customise_sources(
+            cls, settings_cls: type[BaseSettings], **sources: PydanticBaseSettingsSource
+        ) -> tuple[PydanticBaseSettingsSource, ...]:
+            return (config_loader.CachedDotEnvSettingsSource(settings_cls, env_file=env_files),)
+
+    class A(_Base):
+        model_config = SettingsConfigDict(env_prefix="A_", extra="ignore")
+        value: int = 0
+
+    class B(_Base):
+        model_config = SettingsConfigDict(env_prefix="B_", extra="ignore")
+        value: int = 0
+
+    assert A().value == 1
+    assert B().value == 2
+    assert len(reads) == 1
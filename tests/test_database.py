@@ -0,0 +1,178 @@
+"""Test cases for database session management (in-memory SQLite)."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import AsyncAdaptedQueuePool, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core import database
+from app.core.dependencies import get_db
+from app.main_config import DatabaseConfig
+
+pytest.importorskip("aiosqlite")
+
+
+@pytest.fixture
+async def maker(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Install an in-memory sessionmaker as the pool state."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_maker = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    monkeypatch.setitem(database._state, "pool", (engine, session_maker))
+    yield session_maker
+    await engine.dispose()
+
+
+def test_get_sessionmaker_not_initialized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test accessing the pool before init raises."""
+    monkeypatch.setitem(database._state, "pool", None)
+
+    with pytest.raises(RuntimeError, match="not initialized"):
+        database.get_sessionmaker()
+
+
+async def test_get_db_yields_and_closes_session(
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test get_db yields a usable session and closes it afterwards."""
+    gen = get_db()
+    session = await anext(gen)
+
+    assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+    assert session.in_transaction()
+
+    with pytest.raises(StopAsyncIteration):
+        await anext(gen)
+    assert not session.in_transaction()
+
+
+async def test_get_db_rolls_back_on_error(maker: async_sessionmaker[AsyncSession]) -> None:
+    """Test exceptions raised by the route roll back and propagate."""
+    gen = get_db()
+    session = await anext(gen)
+    await session.execute(text("SELECT 1"))
+
+    with pytest.raises(ValueError, match="boom"):
+        await gen.athrow(ValueError("boom"))
+    assert not session.in_transaction()
+
+
+@pytest.mark.parametrize(("pool_size", "max_overflow", "warned"), [(2, 3, True), (5, 5, False)])
+def test_pool_capacity_warning(
+    caplog: pytest.LogCaptureFixture, pool_size: int, max_overflow: int, warned: bool
+) -> None:
+    """Test a warning is logged when pool capacity is below expected concurrency."""
+    config = DatabaseConfig(pool_size=pool_size, max_overflow=max_overflow, expected_concurrency=10)
+
+    with caplog.at_level("INFO", logger=database.__name__):
+        database._check_pool_capacity(config)
+
+    assert any(r.levelname == "WARNING" for r in caplog.records) is warned
+
+
+@pytest.mark.parametrize(("workers", "warned"), [(2, False), (3, True)])
+def test_pool_server_limit_warning(
+    caplog: pytest.LogCaptureFixture, workers: int, warned: bool
+) -> None:
+    """Test a warning is logged when pools across workers exceed the server limit."""
+    config = DatabaseConfig(
+        pool_size=20, max_overflow=30, expected_concurrency=10, max_server_connections=100
+    )
+
+    with caplog.at_level("INFO", logger=database.__name__):
+        database._check_pool_capacity(config, workers)
+
+    assert any(r.levelname == "WARNING" for r in caplog.records) is warned
+
+
+def test_connect_args_only_for_asyncpg() -> None:
+    """Test prepared-statement cache args are only passed to asyncpg."""
+    asyncpg = DatabaseConfig(driver="postgresql+asyncpg", statement_cache_size=100)
+    psycopg = DatabaseConfig(driver="postgresql+psycopg")
+
+    assert asyncpg.connect_args == {
+        "prepared_statement_cache_size": 100,
+        "statement_cache_size": 100,
+    }
+    assert psycopg.connect_args == {}
+
+
+async def test_retry_read_on_disconnect_retries_once() -> None:
+    """Test invalidated connections are retried once, other errors propagate."""
+    calls: list[bool] = []
+
+    @database.retry_read_on_disconnect
+    async def work(invalidated: bool) -> str:
+        calls.append(invalidated)
+        if len(calls) == 1:
+            raise DBAPIError("SELECT 1", {}, Exception("gone"), connection_invalidated=invalidated)
+        return "ok"
+
+    assert await work(True) == "ok"
+    assert len(calls) == 2
+
+    calls.clear()
+    with pytest.raises(DBAPIError):
+        await work(False)
+    assert len(calls) == 1
+
+
+async def test_get_session_rolls_back_and_closes(
+    maker: async_sessionmaker[AsyncSession],
+) -> None:
+    """Test get_session rolls back on error and closes the session on exit."""
+    with pytest.raises(ValueError, match="boom"):
+        async with database.get_session() as session:
+            await session.execute(text("SELECT 1"))
+            assert session.in_transaction()
+            raise ValueError("boom")
+    assert not session.in_transaction()
+
+    async with database.get_session() as session:
+        assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+    assert not session.in_transaction()
+
+
+async def test_warm_pool_opens_distinct_connections(tmp_path: Path) -> None:
+    """Test warm-up leaves the requested number of idle connections in the pool."""
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}", poolclass=AsyncAdaptedQueuePool
+    )
+    await database._warm_pool(engine, 3, 5.0)
+
+    assert engine.pool.checkedin() == 3
+    await engine.dispose()
+
+
+async def test_warm_pool_failure_is_logged(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test warm-up logs connection failures instead of raising."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'warm.db'}")
+
+    with caplog.at_level("WARNING", logger=database.__name__):
+        await database._warm_pool(engine, 3, 5.0)
+
+    assert "warm-up failed" in caplog.text
+    await engine.dispose()
+
+
+async def test_warm_pool_times_out(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test warm-up gives up after the timeout instead of waiting on the driver."""
+
+    async def hang(_engine: object) -> None:
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(database, "_open_checked", hang)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'warm.db'}")
+
+    with caplog.at_level("WARNING", logger=database.__name__):
+        await asyncio.wait_for(database._warm_pool(engine, 3, 0.01), 1)
+
+    assert "warm-up failed" in caplog.text
+    await engine.dispose()
@@ -1,11 +1,17 @@
 """Test cases for exception handling system."""
 
+import copy
+import pickle
+from typing import Any
+
 import pytest
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import IntegrityError
 
 from app.core.exceptions import (
+    AppError,
     BadRequestError,
     ConflictError,
     ErrorResponse,
@@ -17,7 +23,8 @@ from app.core.exceptions import (
 )
 
 
-@pytest.fixture
+# Module-scoped: tests only add routes, each on its own path
+@pytest.fixture(scope="module")
 def app() -> FastAPI:
     """Create test FastAPI application."""
     test_app = FastAPI()
@@ -25,7 +32,7 @@ def app() -> FastAPI:
     return test_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app: FastAPI) -> TestClient:
     """Create test client."""
     return TestClient(app)
@@ -96,79 +103,57 @@ def test_not_found_error_with_params(app: FastAPI, client: TestClient) -> None:
     assert data["path"] == "/test-not-found"
 
 
-def test_bad_request_error(app: FastAPI, client: TestClient) -> None:
-    """Test BadRequestError."""
-
-    @app.get("/test-bad-request")
-    async def route():
-        raise BadRequestError(message="Invalid input", detail={"field": "email"})
-
-    response = client.get("/test-bad-request")
-
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-    data = response.json()
-    assert data["error_code"] == "BadRequestError"
-    assert data["message"] == "Invalid input"
-    assert data["detail"] == {"field": "email"}
-
-
-def test_unauthorized_error(app: FastAPI, client: TestClient) -> None:
-    """Test UnauthorizedError."""
-
-    @app.get("/test-unauthorized")
-    async def route():
-        raise UnauthorizedError(message="Authentication required")
-
-    response = client.get("/test-unauthorized")
-
-    assert response.status_code == status.HTTP_401_UNAUTHORIZED
-    data = response.json()
-    assert data["error_code"] == "UnauthorizedError"
-    assert data["message"] == "Authentication required"
-
-
-def test_forbidden_error(app: FastAPI, client: TestClient) -> None:
-    """Test ForbiddenError."""
-
-    @app.get("/test-forbidden")
-    async def route():
-        raise ForbiddenError(message="Insufficient permissions")
-
-    response = client.get("/test-forbidden")
-
-    assert response.status_code == status.HTTP_403_FORBIDDEN
-    data = response.json()
-    assert data["error_code"] == "ForbiddenError"
-
-
-def test_conflict_error(app: FastAPI, client: TestClient) -> None:
-    """Test ConflictError."""
-
-    @app.get("/test-conflict")
-    async def route():
-        raise ConflictError(message="Resource already exists", detail={"email": "test@example.com"})
-
-    response = client.get("/test-conflict")
-
-    assert response.status_code == status.HTTP_409_CONFLICT
-    data = response.json()
-    assert data["error_code"] == "ConflictError"
-    assert data["detail"] == {"email": "test@example.com"}
-
-
-def test_internal_server_error(app: FastAPI, client: TestClient) -> None:
-    """Test InternalServerError."""
-
-    @app.get("/test-server-error")
+@pytest.mark.parametrize(
+    ("exc_cls", "kwargs", "status_code"),
+    [
+        (
+            BadRequestError,
+            {"message": "Invalid input", "detail": {"field": "email"}},
+            status.HTTP_400_BAD_REQUEST,
+        ),
+        (
+            UnauthorizedError,
+            {"message": "Authentication required"},
+            status.HTTP_401_UNAUTHORIZED,
+        ),
+        (
+            ForbiddenError,
+            {"message": "Insufficient permissions"},
+            status.HTTP_403_FORBIDDEN,
+        ),
+        (
+            ConflictError,
+            {"message": "Resource already exists", "detail": {"email": "test@example.com"}},
+            status.HTTP_409_CONFLICT,
+        ),
+        (
+            InternalServerError,
+            {"message": "Database error", "detail": {"db": "primary"}},
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ),
+    ],
+)
+def test_error_class_status_and_code(
+    app: FastAPI,
+    client: TestClient,
+    exc_cls: type[AppError],
+    kwargs: dict[str, Any],
+    status_code: int,
+) -> None:
+    """Test each error class maps to its status code and class-name error code."""
+    path = f"/test-{exc_cls.__name__}"
+
+    @app.get(path)
     async def route():
-        raise InternalServerError(message="Database error", detail={"db": "primary"})
+        raise exc_cls(**kwargs)
 
-    response = client.get("/test-server-error")
+    response = client.get(path)
 
-    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.status_code == status_code
     data = response.json()
-    assert data["error_code"] == "InternalServerError"
-    assert data["message"] == "Database error"
+    assert data["error_code"] == exc_cls.__name__
+    assert data["message"] == kwargs["message"]
+    assert data.get("detail") == kwargs.get("detail")
 
 
 # =============================================================================
@@ -186,7 +171,7 @@ def test_not_found_error_with_error_response(app: FastAPI, client: TestClient) -
             message="User does not exist",
             detail={"user_id": 456},
         )
-        raise NotFoundError(error)
+        raise NotFoundError.from_response(error)
 
     response = client.get("/test-error-response")
 
@@ -207,7 +192,7 @@ def test_bad_request_with_error_response(app: FastAPI, client: TestClient) -> No
             message="Email format is invalid",
             detail={"email": "invalid@email"},
         )
-        raise BadRequestError(error)
+        raise BadRequestError.from_response(error)
 
     response = client.get("/test-bad-request-obj")
 
@@ -217,6 +202,44 @@ def test_bad_request_with_error_response(app: FastAPI, client: TestClient) -> No
     assert data["message"] == "Email format is invalid"
 
 
+def test_from_response_status_override() -> None:
+    """Test from_response keeps the class status code unless overridden."""
+    error = ErrorResponse(error_code="GONE", message="Gone")
+
+    assert NotFoundError.from_response(error).status_code == status.HTTP_404_NOT_FOUND
+    assert AppError.from_response(error, status_code=410).status_code == 410
+
+
+def test_error_response_positional_deprecated() -> None:
+    """Test passing an ErrorResponse as the message still works but warns."""
+    error = ErrorResponse(error_code="GONE", message="Gone", detail={"id": 1})
+
+    with pytest.warns(DeprecationWarning, match="from_response"):
+        exc = NotFoundError(error)  # type: ignore[arg-type]
+
+    assert exc.message == "Gone"
+    assert exc.error_code == "GONE"
+    assert exc.error_detail == {"id": 1}
+    assert exc.status_code == 404
+
+
+def test_non_str_message_rejected() -> None:
+    """Test messages that are neither str nor ErrorResponse raise TypeError."""
+    with pytest.raises(TypeError, match="must be a str"):
+        NotFoundError(123)  # type: ignore[arg-type]
+
+
+def test_exception_survives_pickle_and_copy() -> None:
+    """Test error fields survive pickling and copying (e.g. across process pools)."""
+    exc = NotFoundError("Gone", error_code="GONE", detail={"id": 1})
+
+    for clone in (pickle.loads(pickle.dumps(exc)), copy.copy(exc)):
+        assert clone.message == "Gone"
+        assert clone.error_code == "GONE"
+        assert clone.error_detail == {"id": 1}
+        assert clone.status_code == 404
+
+
 # =============================================================================
 # Test Default Error Messages
 # =============================================================================
@@ -300,6 +323,22 @@ def test_validation_error_handler(app: FastAPI, client: TestClient) -> None:
     assert "errors" in data["detail"]
 
 
+def test_integrity_error_handler(app: FastAPI, client: TestClient) -> None:
+    """Test IntegrityError maps to 409 with the request path on each response."""
+
+    @app.get("/test-integrity/{item_id}")
+    async def route(item_id: int):
+        raise IntegrityError("INSERT", {}, Exception("duplicate key"))
+
+    first = client.get("/test-integrity/1").json()
+    second = client.get("/test-integrity/2").json()
+
+    assert first["error_code"] == "IntegrityError"
+    assert first["path"] == "/test-integrity/1"
+    assert second["path"] == "/test-integrity/2"
+    assert "detail" not in first
+
+
 # =============================================================================
 # Test to_error_response Method
 # =============================================================================
@@ -0,0 +1,126 @@
+"""Test cases for the shared httpx client pool."""
+
+import asyncio
+import importlib.util
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from app.core import http_calls
+from app.core.http_calls import ClientConfig, HttpxRestClientPool, PoolConfig, TimeoutConfig
+
+
+@pytest.fixture
+async def pool(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[type[HttpxRestClientPool]]:
+    """Configure an HTTP/1.1 pool (h2 is optional) and dispose it afterwards."""
+    monkeypatch.setattr(HttpxRestClientPool, "_config", ClientConfig(http2=False))
+    monkeypatch.setattr(HttpxRestClientPool, "_timeout", HttpxRestClientPool._timeout)
+    monkeypatch.setattr(HttpxRestClientPool, "_limits", HttpxRestClientPool._limits)
+    yield HttpxRestClientPool
+    await HttpxRestClientPool.dispose()
+
+
+async def test_get_client_concurrent_init(pool: type[HttpxRestClientPool]) -> None:
+    """Test concurrent first calls share one client."""
+    clients = await asyncio.gather(*(pool.get_client() for _ in range(10)))
+
+    assert all(client is clients[0] for client in clients)
+    assert await pool.get_client() is clients[0]
+
+
+async def test_dispose_recreates_client(pool: type[HttpxRestClientPool]) -> None:
+    """Test a new client is created after dispose."""
+    first = await pool.get_client()
+    await pool.dispose()
+
+    assert first.is_closed
+    assert await pool.get_client() is not first
+
+
+def test_lock_per_event_loop() -> None:
+    """Test each event loop gets its own init lock."""
+
+    async def get_lock() -> asyncio.Lock:
+        return HttpxRestClientPool._get_lock()
+
+    async def same_loop() -> bool:
+        return await get_lock() is await get_lock()
+
+    assert asyncio.run(same_loop())
+    assert asyncio.run(get_lock()) is not asyncio.run(get_lock())
+
+
+async def test_configure_prebuilds_httpx_settings(pool: type[HttpxRestClientPool]) -> None:
+    """Test configure() builds the timeout and limits used by the client."""
+    pool.configure(
+        ClientConfig(
+            http2=False,
+            timeout=TimeoutConfig(connect=1.0, read=2.0),
+            pool=PoolConfig(max_connections=7),
+        )
+    )
+    client = await pool.get_client()
+
+    assert client.timeout == httpx.Timeout(connect=1.0, read=2.0, write=30.0, pool=30.0)
+    assert pool._limits.max_connections == 7
+
+
+async def test_http2_falls_back_without_h2(
+    pool: type[HttpxRestClientPool], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test HTTP/2 config still builds a client when h2 is missing."""
+    monkeypatch.setattr(HttpxRestClientPool, "_config", ClientConfig(http2=True))
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+
+    assert not pool._http2_enabled()
+    assert not (await pool.get_client()).is_closed
+
+
+async def test_cache_disabled_without_hishel(
+    pool: type[HttpxRestClientPool], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test enabling the cache without hishel keeps the plain transport."""
+    monkeypatch.setattr(HttpxRestClientPool, "_config", ClientConfig(http2=False, cache=True))
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    transport = httpx.AsyncHTTPTransport()
+
+    assert pool._wrap_cache(transport) is transport
+
+
+async def test_authorized_requests_bypass_cache() -> None:
+    """Test requests with credentials skip the shared cache transport."""
+    cached = httpx.MockTransport(lambda request: httpx.Response(200, text="cached"))
+    direct = httpx.MockTransport(lambda request: httpx.Response(200, text="direct"))
+
+    async with httpx.AsyncClient(transport=http_calls._AuthBypassTransport(cached, direct)) as c:
+        anonymous = await c.get("https://example.test/data")
+        authorized = await c.get(
+            "https://example.test/data", headers={"Authorization": "Bearer token"}
+        )
+
+    assert anonymous.text == "cached"
+    assert authorized.text == "direct"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_fetch_url_parses_json(
+    pool: type[HttpxRestClientPool], monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    """Test fetch_url returns parsed JSON with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(http_calls, "_orjson_loads", None)
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"name": "é"}))
+    monkeypatch.setattr(pool, "_client", httpx.AsyncClient(transport=transport))
+
+    assert await http_calls.fetch_url("https://example.test/data") == {"name": "é"}
+
+
+async def test_client_property_after_startup(pool: type[HttpxRestClientPool]) -> None:
+    """Test the synchronous client accessor is None until startup() runs."""
+    assert pool.client is None
+
+    client = await pool.startup()
+
+    assert pool.client is client
+    assert await pool.get_client() is client
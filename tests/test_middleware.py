@@ -0,0 +1,35 @@
+"""Test cases for the request ID middleware."""
+
+from asgi_correlation_id import correlation_id
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.core.middleware import CorrelationIdMiddleware
+
+
+def _make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CorrelationIdMiddleware)
+
+    @app.get("/request-id")
+    async def request_id(request: Request) -> dict[str, str | None]:
+        return {"context": correlation_id.get(), "header": request.headers.get("x-request-id")}
+
+    return TestClient(app)
+
+
+def test_request_id_generated() -> None:
+    """Test a missing header gets a generated ID in context, request and response."""
+    response = _make_client().get("/request-id")
+    request_id = response.headers["x-request-id"]
+
+    assert len(request_id) == 16
+    assert response.json() == {"context": request_id, "header": request_id}
+
+
+def test_request_id_propagated() -> None:
+    """Test an incoming X-Request-ID is reused and echoed back once."""
+    response = _make_client().get("/request-id", headers={"X-Request-ID": "trace-123"})
+
+    assert response.headers.get_list("x-request-id") == ["trace-123"]
+    assert response.json() == {"context": "trace-123", "header": "trace-123"}
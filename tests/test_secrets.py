@@ -0,0 +1,58 @@
+"""Test cases for the file-mode secrets loader."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.secrets import SecretsLoader
+
+
+def test_file_secrets_parsed_once_and_reloaded_on_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the secrets file is parsed once and re-read only when its mtime changes."""
+    loader = SecretsLoader(env="local", base_path=tmp_path)
+    loader.secrets_file.write_text("# comment\nDB_USER='app'\nDB_PASSWORD=\"s3cret\"\n")
+    reads: list[Path] = []
+    read_text = Path.read_text
+    monkeypatch.setattr(Path, "read_text", lambda self: reads.append(self) or read_text(self))
+
+    assert loader.get("DB_USER") == "app"
+    assert loader.get("DB_PASSWORD") == "s3cret"
+    assert loader.get("MISSING", default="x") == "x"
+    assert len(reads) == 1
+
+    loader.secrets_file.write_text("DB_USER=other\n")
+    os.utime(loader.secrets_file, ns=(0, 1))
+
+    assert loader.get("DB_USER") == "other"
+    assert len(reads) == 2
+
+
+def test_missing_secrets_file_uses_default(tmp_path: Path) -> None:
+    """Test a missing secrets file falls back to the default."""
+    loader = SecretsLoader(env="local", base_path=tmp_path)
+
+    assert loader.get("DB_USER", default="postgres") == "postgres"
+
+
+def test_file_secrets_strip_matching_quotes_only(tmp_path: Path) -> None:
+    """Test one pair of matching quotes is removed and inner quotes are kept."""
+    loader = SecretsLoader(env="local", base_path=tmp_path)
+    loader.secrets_file.write_text("A='it\"s'\nB=\"x'\nC=plain\n")
+
+    assert loader.get("A") == 'it"s'
+    assert loader.get("B") == "\"x'"
+    assert loader.get("C") == "plain"
+
+
+def test_env_secrets_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test env-mode secrets are resolved once per loader."""
+    monkeypatch.setenv("EVENTUALLY_API_KEY", "first")
+    loader = SecretsLoader(mode="env")
+
+    assert loader.get("API_KEY") == "first"
+    monkeypatch.setenv("EVENTUALLY_API_KEY", "second")
+    assert loader.get("API_KEY") == "first"
+    assert SecretsLoader(mode="env").get("API_KEY") == "second"